@@ -4,14 +4,14 @@ Jetson TX1 Personal Assistant
 Main application file that orchestrates all components
 """
 
+import asyncio
 import os
 import sys
 import signal
 import logging
-import threading
-import time
 from typing import Optional
 
+import qasync
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 
@@ -41,12 +41,13 @@ def setup_application(config: ConfigManager) -> None:
     global engine
     
     # Setup logging
-    log_config = config.get("logging", {})
+    log_config = config.logging
     setup_logger(
         level=log_config.get("level", "INFO"),
         log_file=log_config.get("file", "assistant.log"),
         max_size=log_config.get("max_size", 10),
-        backup_count=log_config.get("backup_count", 3)
+        backup_count=log_config.get("backup_count", 3),
+        compress=log_config.get("compress", False)
     )
     
     logger = logging.getLogger(__name__)
@@ -56,17 +57,26 @@ def setup_application(config: ConfigManager) -> None:
         # Initialize the core engine
         engine = AssistantEngine(config)
         
-        # Start the engine in a separate thread
-        engine_thread = threading.Thread(target=engine.start, daemon=True)
-        engine_thread.start()
-        
         # Initialize the GUI if enabled
-        gui_config = config.get("gui", {})
-        if gui_config.get("enabled", True):
+        gui_config = config.gui
+        gui_enabled = gui_config.get("enabled", True)
+        
+        # A single event loop drives both Qt and asyncio on the main thread,
+        # so speech results are processed without any cross-thread handoff
+        if gui_enabled:
             app = QApplication(sys.argv)
             app.setApplicationName("Jetson TX1 Assistant")
             app.setApplicationDisplayName("Jetson TX1 Assistant")
-            
+            loop = qasync.QEventLoop(app)
+        else:
+            loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        
+        # Start the engine on the shared loop
+        engine.event_loop = loop
+        engine.start()
+        
+        if gui_enabled:
             # Create and show the main window
             window = MainWindow(engine, config)
             window.show()
@@ -79,15 +89,27 @@ def setup_application(config: ConfigManager) -> None:
             if gui_config.get("start_minimized", False):
                 window.showMinimized()
             
-            # Start the GUI event loop
-            sys.exit(app.exec_())
+            # Run the combined Qt/asyncio event loop; the engine is stopped
+            # while the loop is still open, as in the headless branch
+            with loop:
+                try:
+                    loop.run_forever()
+                finally:
+                    logger.info("Shutting down assistant...")
+                    engine.stop()
+                    loop.run_until_complete(engine.wait_stopped())
         else:
-            # If GUI is disabled, just keep the main thread alive
+            # If GUI is disabled, just run the asyncio event loop until a
+            # signal (or engine.stop()) stops it; no polling needed
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, loop.stop)
             try:
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                signal_handler(None, None)
+                loop.run_forever()
+            finally:
+                logger.info("Shutting down assistant...")
+                engine.stop()
+                loop.run_until_complete(engine.wait_stopped())
+                loop.close()
     
     except Exception as e:
         logger.critical(f"Fatal error: {e}", exc_info=True)
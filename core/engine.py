@@ -5,7 +5,6 @@ Orchestrates all components including speech recognition, TTS, and skills.
 
 import asyncio
 import logging
-import queue
 import threading
 import time
 from typing import Dict, Any, Optional, Callable, Awaitable
@@ -16,6 +15,9 @@ from core.skills_manager import SkillsManager
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of recognized utterances waiting to be processed
+SPEECH_QUEUE_SIZE = 8
+
 class AssistantEngine:
     """Main engine for the personal assistant."""
     
@@ -29,7 +31,8 @@ class AssistantEngine:
         self.config = config
         self.running = False
         self.event_loop = None
-        self.audio_queue = queue.Queue()
+        self.speech_queue: Optional[asyncio.Queue] = None
+        self._speech_task: Optional[asyncio.Task] = None
         self.skills_manager = None
         self._init_components()
     
@@ -74,13 +77,27 @@ class AssistantEngine:
                 return
                 
             text = event.data['text']
-            logger.info(f"Processing speech: {text}")
+            logger.info("Processing speech: %s", text)
             
-            # Run the processing in the event loop
-            asyncio.run_coroutine_threadsafe(
-                self.process_text(text),
-                self.event_loop
-            )
+            # Hand the text to the speech consumer; safe from any thread
+            if self.event_loop is not None and self.speech_queue is not None:
+                self.event_loop.call_soon_threadsafe(self._put_speech, text)
+    
+    def _put_speech(self, text: str) -> None:
+        """Queue recognized text, dropping the oldest utterance when full."""
+        if self.speech_queue.full():
+            dropped = self.speech_queue.get_nowait()
+            logger.warning("Speech queue full, dropping: %s", dropped)
+        self.speech_queue.put_nowait(text)
+    
+    async def _consume_speech(self) -> None:
+        """Process queued speech results one at a time."""
+        while True:
+            text = await self.speech_queue.get()
+            try:
+                await self.process_text(text)
+            except Exception as e:
+                logger.error("Error processing speech: %s", e, exc_info=True)
     
     async def process_text(self, text: str) -> None:
         """
@@ -89,10 +106,11 @@ class AssistantEngine:
         Args:
             text: Input text to process
         """
-        if not text.strip():
+        if not text or text.isspace():
             return
         
-        # Publish speech recognized event
+        # Publish speech recognized event before processing, so the
+        # utterance shows up right away and even if processing fails
         event_bus.publish(Event(
             event_type=EventType.SPEECH_RECOGNIZED,
             data={'text': text}
@@ -102,20 +120,20 @@ class AssistantEngine:
         response, skill = await self.skills_manager.process_text(text)
         
         if response:
-            # Publish response event
-            event_bus.publish(Event(
-                event_type=EventType.RESPONSE_GENERATED,
-                data={
-                    'text': response,
-                    'skill': skill.name if skill else None
-                }
-            ))
-            
-            # Speak the response
-            event_bus.publish(Event(
-                event_type=EventType.TTS_SAY,
-                data={'text': response}
-            ))
+            # Response event and spoken response, published together
+            event_bus.publish_many([
+                Event(
+                    event_type=EventType.RESPONSE_GENERATED,
+                    data={
+                        'text': response,
+                        'skill': skill.name if skill else None
+                    }
+                ),
+                Event(
+                    event_type=EventType.TTS_SAY,
+                    data={'text': response}
+                ),
+            ])
     
     def start(self) -> None:
         """Start the assistant engine."""
@@ -126,25 +144,19 @@ class AssistantEngine:
         logger.info("Starting assistant engine...")
         self.running = True
         
-        # Create a new event loop for this thread
-        self.event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.event_loop)
+        # Run on the loop driving the application (set up by the caller)
+        if self.event_loop is None:
+            self.event_loop = asyncio.get_event_loop()
         
-        try:
-            # Publish startup event
-            event_bus.publish(Event(
-                event_type=EventType.STARTUP,
-                data={'version': '1.0.0'}
-            ))
-            
-            # Start the event loop
-            self.event_loop.run_forever()
-            
-        except Exception as e:
-            logger.critical(f"Fatal error in assistant engine: {e}", exc_info=True)
-            raise
-        finally:
-            self.stop()
+        # Created here so the queue is bound to the engine's loop
+        self.speech_queue = asyncio.Queue(maxsize=SPEECH_QUEUE_SIZE)
+        self._speech_task = self.event_loop.create_task(self._consume_speech())
+        
+        # Publish startup event
+        event_bus.publish(Event(
+            event_type=EventType.STARTUP,
+            data={'version': '1.0.0'}
+        ))
     
     def stop(self) -> None:
         """Stop the assistant engine and clean up resources."""
@@ -158,10 +170,25 @@ class AssistantEngine:
         if self.skills_manager:
             self.skills_manager.stop()
         
+        # Stop processing speech; wait_stopped() lets the cancellation finish
+        if self._speech_task is not None:
+            self._speech_task.cancel()
+        
         # Stop the event loop
         if self.event_loop and self.event_loop.is_running():
-            self.event_loop.call_soon_threadsafe(self.event_loop.stop)
+            self.event_loop.stop()
         
         # Publish shutdown event
         event_bus.publish(Event(event_type=EventType.SHUTDOWN))
         logger.info("Assistant engine stopped")
+    
+    async def wait_stopped(self) -> None:
+        """
+        Wait for the tasks cancelled by stop() to finish.
+        
+        Run this on the event loop after stop() and before closing the loop,
+        or the speech consumer is destroyed while still pending.
+        """
+        task, self._speech_task = self._speech_task, None
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
@@ -5,7 +5,9 @@ Base class for all skills in the Jetson TX1 Personal Assistant.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Type, Callable
+import inspect
 import re
+import sys
 import logging
 from enum import Enum
 
@@ -20,7 +22,10 @@ class SkillPriority(Enum):
     HIGH = 2
     CRITICAL = 3
 
-@dataclass
+# Intents are created for every utterance; use slots where dataclasses support them
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class Intent:
     """Represents a user intent matched by a skill."""
     name: str
@@ -31,6 +36,79 @@ class Intent:
     def __str__(self):
         return f"Intent(name='{self.name}', confidence={self.confidence:.2f})"
 
+def get_dispatch_mode(handler: Callable) -> str:
+    """
+    Work out how a matched intent should be passed to a handler.
+    
+    Args:
+        handler: Intent handler function or bound method
+        
+    Returns:
+        'entities', 'intent' or 'none'
+    """
+    code = getattr(inspect.unwrap(handler), '__code__', None)
+    if code is None:
+        return 'none'
+    
+    params = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+    if 'entities' in params:
+        return 'entities'
+    elif 'intent' in params:
+        return 'intent'
+    return 'none'
+
+# Characters that make an @intent string more than a plain phrase
+_REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+
+# Words of an utterance, used by the keyword prefilter and phrase matching in Skill.match
+_WORD_RE = re.compile(r'\w+')
+
+def _phrase_key(words: List[str]) -> str:
+    """
+    Join words into the form plain phrases are matched in.
+    
+    Words are separated and surrounded by single spaces, so a phrase key
+    occurs in a text key only where the phrase appears as whole words.
+    
+    Args:
+        words: Lowercase words, as found by _WORD_RE
+        
+    Returns:
+        The space-delimited key
+    """
+    return f" {' '.join(words)} "
+
+def _literal_phrase(pattern) -> Optional[str]:
+    """
+    Get the words of a plain phrase pattern, joined by single spaces.
+    
+    Only phrase keys qualify: they are matched on the same words the
+    prefilter in Skill.match looks at, so the prefilter can never reject
+    a text one of them would match.
+    
+    Args:
+        pattern: Pattern as stored by the @intent decorator
+        
+    Returns:
+        The phrase, or None for regexes and callables
+    """
+    return pattern.strip() if isinstance(pattern, str) else None
+
+# Skill subclasses by defining module, filled in as classes are created
+_SKILL_REGISTRY: Dict[str, List[Type['Skill']]] = {}
+
+def registered_skills(module_name: str) -> List[Type['Skill']]:
+    """
+    Get the skill classes defined in a module, in definition order.
+    
+    Args:
+        module_name: Fully qualified module name
+        
+    Returns:
+        List of Skill subclasses (empty if the module defines none)
+    """
+    return list(_SKILL_REGISTRY.get(module_name, ()))
+
 class Skill(ABC):
     """
     Abstract base class for all skills.
@@ -38,6 +116,52 @@ class Skill(ABC):
     To create a new skill, inherit from this class and implement the required methods.
     """
     
+    # (pattern, function, priority) for every @intent handler, collected once per class
+    _class_handlers: List[tuple] = []
+    
+    # Cheap prefilter: at least one of these words must appear in the text, and
+    # the text must be at least this long (empty/0 when it cannot be derived)
+    _required_keywords: frozenset = frozenset()
+    _min_text_len: int = 0
+    
+    def __init_subclass__(cls, **kwargs):
+        """Register a skill class and collect its intent handlers when it is defined."""
+        super().__init_subclass__(**kwargs)
+        _SKILL_REGISTRY.setdefault(cls.__module__, []).append(cls)
+        handlers = []
+        seen = set()
+        for klass in cls.__mro__:
+            for attr_name, attr in vars(klass).items():
+                # Attributes from subclasses shadow those of their bases
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                intent_handlers = getattr(attr, '_intent_handlers', ())
+                if intent_handlers:
+                    # Resolve the call convention once instead of on every dispatch
+                    attr._dispatch_mode = get_dispatch_mode(attr)
+                for pattern, priority in intent_handlers:
+                    handlers.append((attr_name, pattern, attr, priority))
+        
+        # Keep the same (alphabetical) ordering as the previous dir() scan
+        handlers.sort(key=lambda h: h[0])
+        cls._class_handlers = [(pattern, func, priority) for _, pattern, func, priority in handlers]
+        
+        # The prefilter only applies when every handler matches a literal phrase
+        keywords = set()
+        lengths = []
+        for pattern, _, _ in cls._class_handlers:
+            phrase = _literal_phrase(pattern)
+            words = _WORD_RE.findall(phrase) if phrase else None
+            if not words:
+                keywords = set()
+                lengths = []
+                break
+            keywords.add(max(words, key=len))
+            lengths.append(len(phrase))
+        cls._required_keywords = frozenset(keywords)
+        cls._min_text_len = min(lengths, default=0)
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize the skill.
@@ -49,6 +173,7 @@ class Skill(ABC):
         self.enabled = self.config.get('enabled', True)
         self.priority = SkillPriority.NORMAL
         self._handlers = []
+        self._intent_names: Optional[List[str]] = None
         self._register_handlers()
     
     @property
@@ -68,12 +193,23 @@ class Skill(ABC):
         return "1.0.0"
     
     def _register_handlers(self):
-        """Register all handlers decorated with @intent_handler."""
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if hasattr(attr, '_intent_handlers'):
-                for pattern, priority in attr._intent_handlers:
-                    self._handlers.append((pattern, attr, priority))
+        """Bind the class-level intent handlers to this instance."""
+        for pattern, func, priority in type(self)._class_handlers:
+            self._handlers.append((pattern, func.__get__(self, type(self)), priority))
+    
+    def _get_intent_names(self) -> List[str]:
+        """
+        Get the intent name of every handler, in handler order.
+        
+        Built on first use rather than in __init__, since subclasses may set up
+        what their name property depends on after calling super().__init__().
+        
+        Returns:
+            Intent names in the form skill_name.handler_name
+        """
+        if self._intent_names is None or len(self._intent_names) != len(self._handlers):
+            self._intent_names = [f"{self.name}.{handler.__name__}" for _, handler, _ in self._handlers]
+        return self._intent_names
     
     def match(self, text: str) -> Optional[Intent]:
         """
@@ -87,11 +223,22 @@ class Skill(ABC):
         """
         if not self.enabled:
             return None
+        
+        # Lowercasing can lengthen text, so the length check comes after it
+        text_lc = text.lower()
+        if len(text_lc) < self._min_text_len:
+            return None
+        words = _WORD_RE.findall(text_lc)
+        if self._required_keywords and self._required_keywords.isdisjoint(words):
+            return None
+        text_key = _phrase_key(words)
             
         best_match = None
         highest_confidence = 0.0
         
-        for pattern, handler, priority in self._handlers:
+        handlers = self._handlers
+        intent_names = self._get_intent_names()
+        for index, (pattern, handler, priority) in enumerate(handlers):
             # Try regex match first
             if hasattr(pattern, 'pattern'):  # It's a compiled regex
                 match = pattern.search(text)
@@ -100,18 +247,18 @@ class Skill(ABC):
                     if confidence > highest_confidence:
                         entities = match.groupdict()
                         best_match = Intent(
-                            name=f"{self.name}.{handler.__name__}",
+                            name=intent_names[index],
                             confidence=confidence,
                             entities=entities,
                             raw_text=text
                         )
                         highest_confidence = confidence
-            # Then try string matching
-            elif isinstance(pattern, str) and pattern.lower() in text.lower():
+            # Then try phrase matching on whole words (see _phrase_key)
+            elif isinstance(pattern, str) and pattern in text_key:
                 confidence = self._calculate_confidence(text, None, priority)
                 if confidence > highest_confidence:
                     best_match = Intent(
-                        name=f"{self.name}.{handler.__name__}",
+                        name=intent_names[index],
                         confidence=confidence,
                         raw_text=text
                     )
@@ -123,7 +270,7 @@ class Skill(ABC):
                     confidence = result.get('confidence', 0.5)
                     if confidence > highest_confidence:
                         best_match = Intent(
-                            name=f"{self.name}.{handler.__name__}",
+                            name=intent_names[index],
                             confidence=confidence,
                             entities=result.get('entities', {}),
                             raw_text=text
@@ -176,18 +323,17 @@ class Skill(ABC):
         
         try:
             # Call the handler with entities if it accepts them
-            sig = inspect.signature(handler)
-            params = sig.parameters
+            mode = getattr(handler, '_dispatch_mode', None) or get_dispatch_mode(handler)
             
-            if 'entities' in params:
+            if mode == 'entities':
                 return await handler(entities=intent.entities)
-            elif 'intent' in params:
+            elif mode == 'intent':
                 return await handler(intent=intent)
             else:
                 return await handler()
                 
         except Exception as e:
-            logger.error(f"Error in skill '{self.name}': {e}", exc_info=True)
+            logger.error("Error in skill '%s': %s", self.name, e, exc_info=True)
             return "I encountered an error processing that request."
     
     def stop(self):
@@ -200,35 +346,60 @@ def intent(pattern, priority: SkillPriority = SkillPriority.NORMAL):
     Decorator to mark a method as an intent handler.
     
     Args:
-        pattern: String, regex pattern, or callable to match against input text
+        pattern: String, regex pattern, or callable to match against input text,
+            or a list of them
         priority: Priority level for matching
     """
+    patterns = pattern if isinstance(pattern, (list, tuple)) else [pattern]
+    
     def decorator(func):
         if not hasattr(func, '_intent_handlers'):
             func._intent_handlers = []
         
-        # Compile regex if it's a string
-        if isinstance(pattern, str):
-            try:
-                # Convert simple patterns to regex
-                if not (pattern.startswith('^') or pattern.endswith('$')):
-                    # If it's not already a regex, make it a simple word match
-                    regex_pattern = r'\b' + re.escape(pattern.lower()) + r'\b'
-                else:
-                    regex_pattern = pattern
-                
-                compiled = re.compile(regex_pattern, re.IGNORECASE)
-                func._intent_handlers.append((compiled, priority))
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern}': {e}")
-                # Fall back to string matching
-                func._intent_handlers.append((pattern, priority))
-        else:
-            func._intent_handlers.append((pattern, priority))
+        for item in patterns:
+            func._intent_handlers.append((_prepare_pattern(item), priority))
             
         return func
     return decorator
 
+def _prepare_pattern(pattern):
+    """
+    Convert an @intent pattern into the form used for matching.
+    
+    Plain phrases become phrase keys (see _phrase_key), matched against the
+    words of the text without a regex engine; other strings are compiled to
+    regexes, and anything else is kept as is.
+    
+    Args:
+        pattern: String, regex pattern, or callable
+        
+    Returns:
+        The pattern to store in _intent_handlers
+    """
+    if not isinstance(pattern, str):
+        return pattern
+    
+    words = _WORD_RE.findall(pattern.lower())
+    
+    # Plain phrases need no regex engine at all
+    if words and not _REGEX_METACHARS.intersection(pattern):
+        return _phrase_key(words)
+    
+    # Compile regex if it's a string
+    try:
+        # Convert simple patterns to regex
+        if not (pattern.startswith('^') or pattern.endswith('$')):
+            # If it's not already a regex, make it a simple word match
+            regex_pattern = r'\b' + re.escape(pattern.lower()) + r'\b'
+        else:
+            regex_pattern = pattern
+        
+        return re.compile(regex_pattern, re.IGNORECASE)
+    except re.error as e:
+        logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+        # Fall back to (case-insensitive) whole-word matching
+        return _phrase_key(words)
+
 # Example skill implementation
 class ExampleSkill(Skill):
     """Example skill demonstrating the skill interface."""
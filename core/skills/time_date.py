@@ -4,16 +4,81 @@ Provides information about the current time, date, and timezone.
 """
 
 import datetime
-import re
-import pytz
-from typing import Dict, Any, Optional
+import functools
+import time
+import types
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple
 import logging
 
-from .base_skill import Skill, intent, SkillPriority
+try:
+    from zoneinfo import ZoneInfo, available_timezones
+except ImportError:  # Python < 3.9
+    from backports.zoneinfo import ZoneInfo, available_timezones
+
+from .base_skill import Intent, Skill, intent, SkillPriority
 from utils.event_bus import Event, EventType, event_bus
 
 logger = logging.getLogger(__name__)
 
+# Known locations for "time in <location>" queries: casefolded name -> (timezone, display name)
+_LOCATION_TZ: Mapping[str, Tuple[str, str]] = types.MappingProxyType({
+    'new york': ('America/New_York', 'New York'),
+    'london': ('Europe/London', 'London'),
+    'paris': ('Europe/Paris', 'Paris'),
+    'tokyo': ('Asia/Tokyo', 'Tokyo'),
+    'sydney': ('Australia/Sydney', 'Sydney'),
+    'los angeles': ('America/Los_Angeles', 'Los Angeles'),
+    'chicago': ('America/Chicago', 'Chicago'),
+    'beijing': ('Asia/Shanghai', 'Beijing'),
+    'moscow': ('Europe/Moscow', 'Moscow'),
+    'berlin': ('Europe/Berlin', 'Berlin')
+})
+
+# Entity keys that can carry the target of a "time until" query, in order of preference
+_TARGET_TIME_KEYS = ('target_time', 'time', 'event')
+
+# strftime formats used for spoken responses
+_FMT_TIME = "%I:%M %p"
+_FMT_DATE = "%A, %B %d, %Y"
+_FMT_FULL = "%A, %B %d, %Y at %I:%M %p"
+_FMT_DAY = "%A"
+
+# Queries arriving within this window reuse the same clock reading
+_NOW_CACHE_NS = 500_000_000
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_now = datetime.datetime.now
+
+@functools.lru_cache(maxsize=128)
+def _format_wall_time(unix_minute: int, utc_offset: int, include_date: bool) -> str:
+    """
+    Format a wall-clock time, memoized per minute.
+    
+    Args:
+        unix_minute: Minutes since the epoch (UTC)
+        utc_offset: UTC offset of the timezone in seconds
+        include_date: Whether to include the date in the output
+        
+    Returns:
+        Formatted time string
+    """
+    wall = _EPOCH + datetime.timedelta(seconds=unix_minute * 60 + utc_offset)
+    return wall.strftime(_FMT_FULL if include_date else _FMT_TIME)
+
+@functools.lru_cache(maxsize=128)
+def _cached_tz(name: str) -> ZoneInfo:
+    """Look up a timezone by name, reusing the tzinfo for repeated queries."""
+    return ZoneInfo(name)
+
+@functools.lru_cache(maxsize=None)
+def _all_timezones() -> FrozenSet[str]:
+    """Names of every IANA timezone, scanned from the tz database on first use."""
+    return frozenset(available_timezones())
+
+def _is_valid_timezone(timezone_str: str) -> bool:
+    """Check whether a string names a known IANA timezone."""
+    return timezone_str in _all_timezones()
+
 class TimeDateSkill(Skill):
     """Skill for handling time and date related queries."""
     
@@ -21,9 +86,13 @@ class TimeDateSkill(Skill):
         """Initialize the time and date skill."""
         super().__init__(config)
         self.timezone = self.config.get('timezone')
-        if self.timezone and self.timezone not in pytz.all_timezones:
+        if self.timezone and not _is_valid_timezone(self.timezone):
             logger.warning(f"Unknown timezone: {self.timezone}. Using system timezone.")
             self.timezone = None
+        self._default_tz = _cached_tz(self.timezone) if self.timezone else datetime.timezone.utc
+        
+        # Timezone name -> (monotonic_ns, datetime) of the last clock reading
+        self._now_cache: Dict[str, tuple] = {}
     
     @property
     def name(self) -> str:
@@ -50,16 +119,24 @@ class TimeDateSkill(Skill):
         Returns:
             Datetime object with timezone information
         """
-        tz = pytz.timezone(timezone_str) if timezone_str else self._get_timezone()
-        return datetime.datetime.now(tz)
+        tz_key = timezone_str or self.timezone or 'UTC'
+        now_ns = time.monotonic_ns()
+        cached = self._now_cache.get(tz_key)
+        if cached and now_ns - cached[0] < _NOW_CACHE_NS:
+            return cached[1]
+        
+        tz = _cached_tz(timezone_str) if timezone_str else self._get_timezone()
+        current_time = _now(tz)
+        self._now_cache[tz_key] = (now_ns, current_time)
+        return current_time
     
     def _get_timezone(self):
         """Get the configured timezone or system default."""
-        if self.timezone:
-            return pytz.timezone(self.timezone)
-        return pytz.utc  # Default to UTC if no timezone is configured
+        # Resolved in __init__ and handle_set_timezone; UTC if none is configured
+        return self._default_tz
     
-    def format_time(self, dt: datetime.datetime, include_date: bool = False) -> str:
+    @staticmethod
+    def format_time(dt: datetime.datetime, include_date: bool = False) -> str:
         """
         Format a datetime object as a human-readable string.
         
@@ -70,9 +147,12 @@ class TimeDateSkill(Skill):
         Returns:
             Formatted time string
         """
-        if include_date:
-            return dt.strftime("%A, %B %d, %Y at %I:%M %p")
-        return dt.strftime("%I:%M %p")
+        offset = dt.utcoffset()
+        if offset is None:
+            # Naive datetimes have no well-defined minute to cache on
+            return dt.strftime(_FMT_FULL if include_date else _FMT_TIME)
+        
+        return _format_wall_time(int(dt.timestamp() // 60), int(offset.total_seconds()), include_date)
     
     @intent(["what time is it", "what's the time", "current time"], priority=SkillPriority.HIGH)
     async def handle_time_query(self, entities: Dict[str, Any] = None) -> str:
@@ -87,7 +167,7 @@ class TimeDateSkill(Skill):
         """Handle date queries."""
         timezone = entities.get('timezone') if entities else None
         current_time = self.get_current_time(timezone)
-        date_str = current_time.strftime("%A, %B %d, %Y")
+        date_str = current_time.strftime(_FMT_DATE)
         return f"Today is {date_str}."
     
     @intent(["what day is it", "what day is today"], priority=SkillPriority.HIGH)
@@ -95,45 +175,32 @@ class TimeDateSkill(Skill):
         """Handle day of the week queries."""
         timezone = entities.get('timezone') if entities else None
         current_time = self.get_current_time(timezone)
-        day_str = current_time.strftime("%A")
+        day_str = current_time.strftime(_FMT_DAY)
         return f"Today is {day_str}."
     
-    @intent(re.compile(r"time in (?P<location>[\w\s]+)", re.IGNORECASE))
-    async def handle_time_in_location(self, entities: Dict[str, Any] = None) -> str:
+    @intent(["time in", "what time is it in"], priority=SkillPriority.HIGH)
+    async def handle_time_in_location(self, intent: Intent) -> str:
         """Handle time in specific location queries."""
-        if not entities or 'location' not in entities:
+        # The location is whatever follows the last " in " of the utterance
+        location = intent.entities.get('location')
+        if not location:
+            _, sep, rest = intent.raw_text.casefold().rpartition(' in ')
+            location = rest.strip().rstrip('?.!') if sep else ''
+        if not location:
             return "I'm not sure which location you're asking about."
         
-        location = entities['location'].lower()
-        timezone_map = {
-            'new york': 'America/New_York',
-            'london': 'Europe/London',
-            'paris': 'Europe/Paris',
-            'tokyo': 'Asia/Tokyo',
-            'sydney': 'Australia/Sydney',
-            'los angeles': 'America/Los_Angeles',
-            'chicago': 'America/Chicago',
-            'beijing': 'Asia/Shanghai',
-            'moscow': 'Europe/Moscow',
-            'berlin': 'Europe/Berlin'
-        }
-        
-        timezone_str = timezone_map.get(location)
-        if not timezone_str:
+        known = _LOCATION_TZ.get(location.casefold())
+        if not known:
             return f"I don't know the timezone for {location}."
         
+        timezone_str, display_name = known
         try:
             current_time = self.get_current_time(timezone_str)
             time_str = self.format_time(current_time, include_date=True)
-            return f"The current time in {location.title()} is {time_str}."
+            return f"The current time in {display_name} is {time_str}."
         except Exception as e:
-            logger.error(f"Error getting time for {location}: {e}")
-            return f"I couldn't get the time for {location}."
-    
-    @intent(["what time is it in"], priority=SkillPriority.HIGH)
-    async def handle_time_in_location_alt(self, entities: Dict[str, Any] = None) -> str:
-        """Alternative handler for time in location queries."""
-        return await self.handle_time_in_location(entities)
+            logger.error("Error getting time for %s: %s", display_name, e)
+            return f"I couldn't get the time for {display_name}."
     
     @intent(["set timezone", "change timezone"])
     async def handle_set_timezone(self, entities: Dict[str, Any] = None) -> str:
@@ -142,10 +209,11 @@ class TimeDateSkill(Skill):
             return "Please specify a timezone, for example: 'Set timezone to America/New_York'"
         
         timezone_str = entities['timezone']
-        if timezone_str not in pytz.all_timezones:
+        if not _is_valid_timezone(timezone_str):
             return f"I don't recognize the timezone '{timezone_str}'. Please use a valid timezone like 'America/New_York'."
         
         self.timezone = timezone_str
+        self._default_tz = _cached_tz(timezone_str)
         return f"Timezone set to {timezone_str}."
     
     @intent(["what's my timezone", "current timezone"])
@@ -157,11 +225,11 @@ class TimeDateSkill(Skill):
     @intent(["time until"], priority=SkillPriority.HIGH)
     async def handle_time_until(self, entities: Dict[str, Any] = None) -> str:
         """Handle time until a specific time or event."""
-        if not entities or not any(key in entities for key in ['target_time', 'time', 'event']):
+        # Take the target time from the first of the possible entity keys that is set
+        target_time = next((entities[key] for key in _TARGET_TIME_KEYS if entities and entities.get(key)), None)
+        if target_time is None:
             return "Please specify what time or event you want to know the time until."
         
-        # Try to get the target time from any of the possible entity keys
-        target_time = entities.get('target_time') or entities.get('time') or entities.get('event')
         return f"I would calculate the time until {target_time}, but this feature isn't implemented yet."
     
     @intent(["set alarm", "set a timer"])
@@ -4,18 +4,51 @@ Handles loading, managing, and dispatching to skills.
 """
 
 import importlib
-import inspect
+import importlib.metadata
 import logging
 import os
 import pkgutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Type, Any, Optional, Tuple
 
-from .skills.base_skill import Skill, Intent
+from .skills.base_skill import Skill, Intent, registered_skills
 from utils.event_bus import Event, EventType, event_bus
 from utils.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Entry point group through which installed packages can provide skills
+SKILL_ENTRY_POINT_GROUP = 'jetson_assistant.skills'
+
+# Upper bound on threads importing skill modules at startup
+SKILL_LOADER_THREADS = 4
+
+# Built-in skills as name -> 'module:ClassName'
+BUILTIN_SKILLS = {
+    'time_date': 'core.skills.time_date:TimeDateSkill',
+}
+
+def _skill_manifest() -> Dict[str, str]:
+    """
+    Collect the skills to load without importing anything.
+    
+    Returns:
+        Dictionary mapping skill names to 'module:ClassName' targets
+    """
+    manifest = dict(BUILTIN_SKILLS)
+    try:
+        entry_points = importlib.metadata.entry_points()
+        if hasattr(entry_points, 'select'):
+            entry_points = entry_points.select(group=SKILL_ENTRY_POINT_GROUP)
+        else:  # Python < 3.10
+            entry_points = entry_points.get(SKILL_ENTRY_POINT_GROUP, ())
+        for entry_point in entry_points:
+            manifest.setdefault(entry_point.name, entry_point.value)
+    except Exception as e:
+        logger.debug(f"Could not read skill entry points: {e}")
+    return manifest
+
 class SkillsManager:
     """Manages all skills for the assistant."""
     
@@ -27,46 +60,128 @@ class SkillsManager:
             config: Configuration manager instance
         """
         self.config = config
-        self.skills: Dict[str, Skill] = {}
+        self._skills: Dict[str, Skill] = {}
+        self._loaded = False
+        
+        # Events raised while loading skills, published together once loading is done
+        self._pending_events: Optional[List[Event]] = None
         self.skills_dir = os.path.join(os.path.dirname(__file__), 'skills')
-        self._load_skills()
+        
+        # Skills in the order they are asked to match, see _build_dispatch_index()
+        self._dispatch_skills: List[Skill] = []
+    
+    @property
+    def skills(self) -> Dict[str, Skill]:
+        """Loaded skills by name; skills are imported and created on first use."""
+        if not self._loaded:
+            self._load_skills()
+        return self._skills
     
     def _load_skills(self) -> None:
         """Load all available skills."""
         logger.info("Loading skills...")
+        self._loaded = True
         
-        # Built-in skills
-        builtin_skills = [
-            'time_date'
-        ]
+        manifest = _skill_manifest()
+        dir_modules = self._skill_dir_modules() if os.path.exists(self.skills_dir) else []
         
-        # Load built-in skills
-        for skill_name in builtin_skills:
-            self._load_skill(f"core.skills.{skill_name}")
+        # Imports are dominated by flash reads, so warm the module cache in parallel;
+        # skills are still created below in a fixed order
+        self._preload_modules([target.partition(':')[0] for target in manifest.values()] + dir_modules)
         
-        # Load custom skills from the skills directory if it exists
-        if os.path.exists(self.skills_dir):
-            self._load_skills_from_dir()
+        self._pending_events = []
+        try:
+            # Built-in and installed skills are imported straight from the manifest
+            for skill_name, target in manifest.items():
+                self._load_skill_entry(skill_name, target)
+            
+            # Load custom skills from the skills directory
+            for module_path in dir_modules:
+                try:
+                    self._load_skill(module_path)
+                except Exception as e:
+                    logger.error(f"Failed to load skill {module_path}: {e}", exc_info=True)
+            
+            self._build_dispatch_index()
+        finally:
+            events, self._pending_events = self._pending_events, None
+            event_bus.publish_many(events)
+        logger.info(f"Loaded {len(self._skills)} skills")
+    
+    @staticmethod
+    def _preload_modules(module_paths: List[str]) -> None:
+        """
+        Import modules concurrently so their file I/O overlaps.
         
-        logger.info(f"Loaded {len(self.skills)} skills")
+        Failures are ignored here; they are reported when the skill is loaded.
+        
+        Args:
+            module_paths: Dotted module paths to import
+        """
+        pending = [path for path in module_paths if path not in sys.modules]
+        if len(pending) < 2:
+            return
+        
+        def preload(module_path: str) -> None:
+            try:
+                importlib.import_module(module_path)
+            except Exception:
+                pass
+        
+        with ThreadPoolExecutor(max_workers=min(SKILL_LOADER_THREADS, len(pending))) as executor:
+            list(executor.map(preload, pending))
+    
+    def _build_dispatch_index(self) -> None:
+        """
+        Order the loaded skills for matching.
+        
+        Skills are ordered by their highest intent priority, so the ones that
+        can reach full confidence are consulted first.
+        """
+        self._dispatch_skills = sorted(
+            self._skills.values(),
+            key=lambda skill: max((priority.value for _, _, priority in skill._handlers), default=0),
+            reverse=True)
     
-    def _load_skills_from_dir(self) -> None:
-        """Load skills from the skills directory."""
+    def _skill_dir_modules(self) -> List[str]:
+        """
+        List the modules in the skills directory.
+        
+        Returns:
+            Dotted module paths importable as 'skills.<name>'
+        """
         try:
             # Add the skills directory to the Python path
-            import sys
             skills_parent = os.path.dirname(self.skills_dir)
             if skills_parent not in sys.path:
                 sys.path.insert(0, skills_parent)
             
-            # Import all modules in the skills directory
-            for _, name, _ in pkgutil.iter_modules([self.skills_dir]):
-                try:
-                    self._load_skill(f"skills.{name}")
-                except Exception as e:
-                    logger.error(f"Failed to load skill {name}: {e}", exc_info=True)
+            return [f"skills.{name}" for _, name, _ in pkgutil.iter_modules([self.skills_dir])]
         except Exception as e:
             logger.error(f"Error loading skills from directory: {e}", exc_info=True)
+            return []
+    
+    def _load_skill_entry(self, skill_name: str, target: str) -> bool:
+        """
+        Load a skill from a manifest entry without scanning its module.
+        
+        Args:
+            skill_name: Manifest name of the skill
+            target: Location of the skill class as 'module:ClassName'
+            
+        Returns:
+            bool: True if the skill was loaded successfully, False otherwise
+        """
+        module_path, _, class_name = target.partition(':')
+        try:
+            skill_class = getattr(importlib.import_module(module_path), class_name)
+            return self._init_skill(skill_class, module_path) is not False
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Failed to load skill {skill_name} from {target}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error loading skill {skill_name} from {target}: {e}", exc_info=True)
+            return False
     
     def _load_skill(self, module_path: str) -> bool:
         """
@@ -82,52 +197,11 @@ class SkillsManager:
             # Import the module
             module = importlib.import_module(module_path)
             
-            # Find all classes that inherit from Skill
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (issubclass(obj, Skill) and obj != Skill and 
-                    obj.__module__ == module.__name__):
-                    
-                    # Check if the skill is enabled in the config
-                    skill_config = self.config.get(f"skills.{obj.__name__.lower()}", {})
-                    if not skill_config.get('enabled', True):
-                        logger.info(f"Skill {obj.__name__} is disabled in config")
-                        continue
-                    
-                    # Initialize the skill
-                    try:
-                        skill_instance = obj(skill_config)
-                        skill_name = skill_instance.name
-                        
-                        if skill_name in self.skills:
-                            logger.warning(f"Skill with name '{skill_name}' already exists. Overwriting.")
-                        
-                        self.skills[skill_name] = skill_instance
-                        logger.info(f"Loaded skill: {skill_name} (v{skill_instance.version})")
-                        
-                        # Publish skill loaded event
-                        event_bus.publish(Event(
-                            event_type=EventType.SKILL_LOADED,
-                            data={
-                                'name': skill_name,
-                                'version': skill_instance.version,
-                                'description': skill_instance.description
-                            }
-                        ))
-                        
-                        return True
-                    except Exception as e:
-                        logger.error(f"Failed to initialize skill {name}: {e}", exc_info=True)
-                        
-                        # Publish skill error event
-                        event_bus.publish(Event(
-                            event_type=EventType.SKILL_ERROR,
-                            data={
-                                'module': module_path,
-                                'error': str(e)
-                            }
-                        ))
-                        
-                        return False
+            # Skill subclasses register themselves with base_skill when defined
+            for skill_class in registered_skills(module.__name__):
+                loaded = self._init_skill(skill_class, module_path)
+                if loaded is not None:
+                    return loaded
             
             logger.warning(f"No Skill class found in module: {module_path}")
             return False
@@ -139,6 +213,72 @@ class SkillsManager:
             logger.error(f"Unexpected error loading skill {module_path}: {e}", exc_info=True)
             return False
     
+    def _init_skill(self, skill_class: Type[Skill], module_path: str) -> Optional[bool]:
+        """
+        Create and register an instance of a skill class.
+        
+        Args:
+            skill_class: Skill subclass to instantiate
+            module_path: Module the class was loaded from, for error reporting
+            
+        Returns:
+            True if the skill was loaded, False if it failed to initialize,
+            None if it is disabled in the config
+        """
+        # Check if the skill is enabled in the config
+        skill_config = self.config.get(f"skills.{skill_class.__name__.lower()}", {})
+        if not skill_config.get('enabled', True):
+            logger.info(f"Skill {skill_class.__name__} is disabled in config")
+            return None
+        
+        # Initialize the skill
+        try:
+            skill_instance = skill_class(skill_config)
+            skill_name = skill_instance.name
+            
+            if skill_name in self._skills:
+                logger.warning(f"Skill with name '{skill_name}' already exists. Overwriting.")
+            
+            self._skills[skill_name] = skill_instance
+            logger.info(f"Loaded skill: {skill_name} (v{skill_instance.version})")
+            
+            # Publish skill loaded event
+            self._publish(Event(
+                event_type=EventType.SKILL_LOADED,
+                data={
+                    'name': skill_name,
+                    'version': skill_instance.version,
+                    'description': skill_instance.description
+                }
+            ))
+            
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize skill {skill_class.__name__}: {e}", exc_info=True)
+            
+            # Publish skill error event
+            self._publish(Event(
+                event_type=EventType.SKILL_ERROR,
+                data={
+                    'module': module_path,
+                    'error': str(e)
+                }
+            ))
+            
+            return False
+    
+    def _publish(self, event: Event) -> None:
+        """
+        Publish a skill event, or hold it back while skills are being loaded.
+        
+        Args:
+            event: Event to publish
+        """
+        if self._pending_events is not None:
+            self._pending_events.append(event)
+        else:
+            event_bus.publish(event)
+    
     def get_skill(self, skill_name: str) -> Optional[Skill]:
         """
         Get a skill by name.
@@ -170,32 +310,38 @@ class SkillsManager:
         Returns:
             Tuple of (response_text, skill) or (None, None) if no match found
         """
-        if not text.strip():
+        if not text or text.isspace():
             return None, None
         
+        if not self._loaded:
+            self._load_skills()
+        
         best_match = None
         best_intent = None
         highest_confidence = 0.0
         
         # Find the best matching skill and intent
-        for skill in self.skills.values():
+        for skill in self._dispatch_skills:
             try:
                 intent = skill.match(text)
                 if intent and intent.confidence > highest_confidence:
                     best_match = skill
                     best_intent = intent
                     highest_confidence = intent.confidence
+                    if highest_confidence >= 1.0:
+                        break  # Full confidence cannot be beaten
             except Exception as e:
-                logger.error(f"Error in skill {skill.name}: {e}", exc_info=True)
+                logger.error("Error in skill %s: %s", skill.name, e, exc_info=True)
         
         # If we found a match, handle it
         if best_match and best_intent:
-            logger.info(f"Matched intent: {best_intent} (confidence: {highest_confidence:.2f})")
+            # Lazy formatting: Intent.__str__ only runs if the record is emitted
+            logger.info("Matched intent: %s (confidence: %.2f)", best_intent, highest_confidence)
             try:
                 response = await best_match.handle(best_intent)
                 return response, best_match
             except Exception as e:
-                logger.error(f"Error handling intent with {best_match.name}: {e}", exc_info=True)
+                logger.error("Error handling intent with %s: %s", best_match.name, e, exc_info=True)
                 return f"I encountered an error processing that request: {str(e)}", best_match
         
         return None, None
@@ -203,11 +349,12 @@ class SkillsManager:
     def stop(self) -> None:
         """Stop all skills and clean up resources."""
         logger.info("Stopping all skills...")
-        for skill in self.skills.values():
+        for skill in self._skills.values():
             try:
                 skill.stop()
             except Exception as e:
                 logger.error(f"Error stopping skill {skill.name}: {e}", exc_info=True)
         
-        self.skills.clear()
+        self._skills.clear()
+        self._build_dispatch_index()
         logger.info("All skills stopped")
@@ -43,6 +43,9 @@ setup(
         "console_scripts": [
             "jetson-assistant=assistant:main",
         ],
+        "jetson_assistant.skills": [
+            "time_date=core.skills.time_date:TimeDateSkill",
+        ],
     },
     project_urls={
         "Bug Reports": "https://github.com/yourusername/jetson-assistant/issues",
@@ -0,0 +1,59 @@
+"""
+Tests for reading and changing configuration through ConfigManager.
+"""
+
+import pytest
+
+from utils.config_manager import ConfigManager
+
+CONFIG_YAML = """\
+gui:
+  theme: light
+logging:
+  level: DEBUG
+"""
+
+@pytest.fixture
+def config(tmp_path):
+    """Configuration manager for a small config file."""
+    path = tmp_path / "config.yml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    return ConfigManager(str(path))
+
+def test_get_reads_values_and_defaults(config):
+    """Dot-notation keys reach values from the file and the defaults."""
+    assert config.get('gui.theme') == 'light'
+    assert config.get('gui.enabled') is True
+    assert config.get('gui')['theme'] == 'light'
+    assert config.get('gui.missing', 'fallback') == 'fallback'
+
+def test_sections_cannot_be_changed_through_get(config):
+    """Sections returned by get() are read-only, so get() never goes stale."""
+    gui = config.get('gui')
+    with pytest.raises(TypeError):
+        gui['theme'] = 'dark'
+    with pytest.raises(TypeError):
+        gui['new_key'] = True
+    
+    assert config.get('gui.theme') == 'light'
+    assert config.get('gui.new_key') is None
+
+def test_set_updates_keys_and_sections(config):
+    """Changes made with set() show up through every way of reading them."""
+    config.set('gui.theme', 'dark')
+    config.set('gui.new_key', True)
+    
+    assert config.get('gui.theme') == 'dark'
+    assert config.get('gui')['theme'] == 'dark'
+    assert config.get('gui.new_key') is True
+    assert config.to_dict()['gui']['new_key'] is True
+
+def test_to_dict_copy_is_independent(config):
+    """A copied configuration can be changed without affecting the manager."""
+    copied = config.to_dict(copy=True)
+    copied['gui']['theme'] = 'dark'
+    copied['gui'].update(new_key=True)
+    
+    assert isinstance(copied['gui'], dict)
+    assert config.get('gui.theme') == 'light'
+    assert config.get('gui.new_key') is None
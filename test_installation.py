@@ -2,15 +2,15 @@
 Test script to verify the Jetson Assistant installation.
 """
 
+import os
 import sys
 import logging
-from utils.config_manager import ConfigManager
-from utils.logger import setup_logger
 
 def test_config_loading():
     """Test if the configuration loads correctly."""
     print("Testing configuration loading...")
     try:
+        from utils.config_manager import ConfigManager
         config = ConfigManager("config.yml")
         print("[OK] Configuration loaded successfully")
         return True
@@ -22,6 +22,7 @@ def test_logging():
     """Test if logging is working."""
     print("\nTesting logging...")
     try:
+        from utils.logger import setup_logger
         setup_logger(level="DEBUG", log_file="test.log")
         logger = logging.getLogger(__name__)
         logger.debug("This is a debug message")
@@ -37,26 +38,33 @@ def test_logging():
 def test_imports():
     """Test if all required modules can be imported."""
     print("\nTesting imports...")
-    modules = [
+    ui_modules = [
         "PyQt5.QtWidgets",
         "PyQt5.QtCore",
         "PyQt5.QtGui",
+        "ui.main_window"
+    ]
+    modules = [
         "yaml",
         "numpy",
         "pyaudio",
         "speech_recognition",
         "gtts",
-        "pytz",
         "python_dateutil",
         "core.engine",
         "core.skills.time_date",
         "core.skills.base_skill",
-        "ui.main_window",
         "utils.config_manager",
         "utils.event_bus",
         "utils.logger"
     ]
     
+    # Qt is slow to load and of no use without a display
+    if os.environ.get('DISPLAY'):
+        modules = ui_modules + modules
+    else:
+        print("[SKIP] No DISPLAY set, skipping GUI modules")
+    
     success = True
     for module in modules:
         try:
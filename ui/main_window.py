@@ -8,16 +8,188 @@ import os
 import sys
 import time
 import logging
+from collections import deque
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QPushButton, QLabel, QTextEdit, QProgressBar,
+                            QPushButton, QLabel, QPlainTextEdit, QProgressBar,
                             QSystemTrayIcon, QMenu, QAction, QMessageBox)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QSize
-from PyQt5.QtGui import QIcon, QFont, QPixmap
+from PyQt5.QtGui import QColor, QIcon, QFont, QPixmap, QPixmapCache, QTextCharFormat, QTextCursor
+
+# Default number of lines kept in the conversation display (gui.max_log_lines)
+DEFAULT_MAX_LOG_LINES = 2000
+
+# Messages arriving within this window are added to the display together
+MESSAGE_FLUSH_INTERVAL_MS = 30
+
+# Audio level updates closer together than this are dropped
+AUDIO_LEVEL_MIN_INTERVAL = 0.05
+
+# How long the status indicator stays red after an error
+ERROR_INDICATOR_MS = 3000
+
+# Theme stylesheets
+_DARK_QSS = """
+QMainWindow, QWidget {
+    background-color: #2D2D30;
+    color: #FFFFFF;
+}
+QLabel {
+    color: #FFFFFF;
+}
+QPushButton {
+    background-color: #3E3E42;
+    color: #FFFFFF;
+    border: 1px solid #555555;
+    padding: 5px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #555555;
+}
+QPushButton:pressed {
+    background-color: #007ACC;
+}
+QPlainTextEdit {
+    background-color: #1E1E1E;
+    color: #FFFFFF;
+    border: 1px solid #3E3E42;
+}
+QProgressBar {
+    border: 1px solid #3E3E42;
+    border-radius: 3px;
+    background-color: #1E1E1E;
+}
+QProgressBar::chunk {
+    background-color: #007ACC;
+    width: 1px;
+}
+QLabel#statusDot {
+    color: green;
+}
+QLabel#statusDot[state="active"] {
+    color: blue;
+}
+QLabel#statusDot[state="error"] {
+    color: red;
+}
+"""
+
+_LIGHT_QSS = """
+QMainWindow, QWidget {
+    background-color: #F0F0F0;
+    color: #000000;
+}
+QLabel {
+    color: #000000;
+}
+QPushButton {
+    background-color: #E0E0E0;
+    color: #000000;
+    border: 1px solid #CCCCCC;
+    padding: 5px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #CCCCCC;
+}
+QPushButton:pressed {
+    background-color: #007ACC;
+    color: #FFFFFF;
+}
+QPlainTextEdit {
+    background-color: #FFFFFF;
+    color: #000000;
+    border: 1px solid #CCCCCC;
+}
+QProgressBar {
+    border: 1px solid #CCCCCC;
+    border-radius: 3px;
+    background-color: #FFFFFF;
+}
+QProgressBar::chunk {
+    background-color: #007ACC;
+    width: 1px;
+}
+QLabel#statusDot {
+    color: green;
+}
+QLabel#statusDot[state="active"] {
+    color: blue;
+}
+QLabel#statusDot[state="error"] {
+    color: red;
+}
+"""
+
+# Directory holding the logo and icon images
+_RESOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources")
+
+# Pre-scaled copies of the resource images, so they are not rescaled at every start
+ICON_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "jetson_assistant"
+)
+LOGO_SIZE = 64
+TRAY_ICON_SIZE = 64
+
+
+def load_scaled_pixmap(path, size):
+    """
+    Load an image scaled to fit size x size, using the on-disk cache when it is current
+    
+    Args:
+        path (str): Path to the source image
+        size (int): Width and height to fit the image into
+        
+    Returns:
+        QPixmap: Scaled image
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(ICON_CACHE_DIR, f"{name}_{size}.png")
+    
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            pixmap = QPixmap(cache_path)
+            if not pixmap.isNull():
+                return pixmap
+    except OSError:
+        pass
+    
+    pixmap = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    try:
+        os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+        pixmap.save(cache_path, "PNG")
+    except OSError as e:
+        logging.debug(f"Could not cache scaled image {cache_path}: {e}")
+    return pixmap
+
+
+def _cached_pixmap(path, size):
+    """
+    Get a scaled resource image, shared through QPixmapCache
+    
+    Args:
+        path (str): Path to the source image
+        size (int): Width and height to fit the image into
+        
+    Returns:
+        QPixmap: Scaled image
+    """
+    key = f"{path}@{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = load_scaled_pixmap(path, size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 class MainWindow(QMainWindow):
     """Main window for the personal assistant GUI"""
     
+    # Carry events from whichever thread publishes them to the GUI thread
+    audio_level_changed = pyqtSignal(int)
+    _bus_event = pyqtSignal(object, object)
+    
     def __init__(self, engine, config):
         """
         Initialize the main window
@@ -30,6 +202,7 @@ class MainWindow(QMainWindow):
         
         self.engine = engine
         self.config = config
+        self._current_qss = None
         
         # Set up the UI
         self.setup_ui()
@@ -45,13 +218,13 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Jetson TX1 Personal Assistant")
         self.setMinimumSize(600, 400)
         
-        # Set theme
-        self.set_theme(self.config.get("gui.theme", "dark"))
-        
         # Create central widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         
+        # Set theme
+        self.set_theme(self.config.get("gui.theme", "dark"))
+        
         self.main_layout = QVBoxLayout()
         self.central_widget.setLayout(self.main_layout)
         
@@ -76,18 +249,14 @@ class MainWindow(QMainWindow):
         
         # Logo label
         self.logo_label = QLabel()
-        self.logo_label.setMaximumSize(64, 64)
-        self.logo_label.setMinimumSize(64, 64)
+        self.logo_label.setMaximumSize(LOGO_SIZE, LOGO_SIZE)
+        self.logo_label.setMinimumSize(LOGO_SIZE, LOGO_SIZE)
         
         # Load logo if exists, otherwise show text
-        logo_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "resources", "logo.png"
-        )
-        
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            self.logo_label.setPixmap(pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_path = os.path.join(_RESOURCE_DIR, "logo.png")
+        
+        if os.path.isfile(logo_path):
+            self.logo_label.setPixmap(_cached_pixmap(logo_path, LOGO_SIZE))
         else:
             self.logo_label.setText("Jetson\nAssistant")
             self.logo_label.setAlignment(Qt.AlignCenter)
@@ -128,12 +297,35 @@ class MainWindow(QMainWindow):
     
     def setup_conversation_display(self):
         """Set up the conversation display area"""
-        # Conversation history
-        self.conversation_display = QTextEdit()
+        # Conversation history; plain-text layout with a bounded number of lines
+        # keeps appends cheap however long the conversation gets
+        self.conversation_display = QPlainTextEdit()
         self.conversation_display.setReadOnly(True)
+        self.conversation_display.setMaximumBlockCount(
+            self.config.get("gui.max_log_lines", DEFAULT_MAX_LOG_LINES))
         self.conversation_display.setMinimumHeight(200)
         self.main_layout.addWidget(self.conversation_display)
         
+        # Role -> (prefix, prefix format, text format); messages are inserted as
+        # formatted plain text, so no HTML is parsed per message
+        label_format = QTextCharFormat()
+        label_format.setFontWeight(QFont.Bold)
+        system_format = QTextCharFormat()
+        system_format.setFontItalic(True)
+        system_format.setForeground(QColor("#888888"))
+        self._message_formats = {
+            "user": ("You: ", label_format, QTextCharFormat()),
+            "assistant": ("Assistant: ", label_format, QTextCharFormat()),
+            "system": ("System: ", system_format, system_format),
+        }
+        
+        # Messages waiting to be added by _flush_messages
+        self._pending_messages = deque()
+        self._message_flush_timer = QTimer(self)
+        self._message_flush_timer.setSingleShot(True)
+        self._message_flush_timer.setInterval(MESSAGE_FLUSH_INTERVAL_MS)
+        self._message_flush_timer.timeout.connect(self._flush_messages)
+        
         # Add welcome message
         self.add_assistant_message("Welcome to your Jetson TX1 Personal Assistant. Say the wake word or press Activate to begin.")
         
@@ -149,6 +341,8 @@ class MainWindow(QMainWindow):
         self.activity_bar.setTextVisible(False)
         self.activity_bar.setMaximumHeight(15)
         activity_layout.addWidget(self.activity_bar)
+        self._last_level_time = 0.0
+        self._activity_visible = False  # Updated by showEvent/hideEvent
         
         self.main_layout.addLayout(activity_layout)
     
@@ -160,8 +354,10 @@ class MainWindow(QMainWindow):
         self.wake_word_label = QLabel(f"Wake Word: {self.config.get('wake_word.word', 'Jetson')}")
         self.statusBar().addPermanentWidget(self.wake_word_label)
         
+        # Coloured by the theme according to its "state" property
         self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet("color: green;")
+        self.status_indicator.setObjectName("statusDot")
+        self.status_indicator.setProperty("state", "ready")
         self.statusBar().addPermanentWidget(self.status_indicator)
     
     def setup_system_tray(self):
@@ -170,13 +366,10 @@ class MainWindow(QMainWindow):
         self.tray_icon = QSystemTrayIcon(self)
         
         # Load icon if exists, otherwise use system default
-        icon_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "resources", "icon.png"
-        )
+        icon_path = os.path.join(_RESOURCE_DIR, "icon.png")
         
-        if os.path.exists(icon_path):
-            self.tray_icon.setIcon(QIcon(icon_path))
+        if os.path.isfile(icon_path):
+            self.tray_icon.setIcon(QIcon(_cached_pixmap(icon_path, TRAY_ICON_SIZE)))
         else:
             self.tray_icon.setIcon(self.style().standardIcon(self.style().SP_ComputerIcon))
         
@@ -205,10 +398,11 @@ class MainWindow(QMainWindow):
     
     def setup_timers(self):
         """Set up timers for UI updates"""
-        # Activity update timer
-        self.activity_timer = QTimer(self)
-        self.activity_timer.timeout.connect(self.update_activity_indicator)
-        self.activity_timer.start(100)  # Update every 100ms
+        # Returns the status indicator to normal after an error; restarted by each error
+        self._error_reset_timer = QTimer(self)
+        self._error_reset_timer.setSingleShot(True)
+        self._error_reset_timer.setInterval(ERROR_INDICATOR_MS)
+        self._error_reset_timer.timeout.connect(self._reset_status_indicator)
     
     def set_theme(self, theme):
         """
@@ -217,163 +411,157 @@ class MainWindow(QMainWindow):
         Args:
             theme (str): Theme name (dark or light)
         """
-        if theme == "dark":
-            self.setStyleSheet("""
-                QMainWindow, QWidget {
-                    background-color: #2D2D30;
-                    color: #FFFFFF;
-                }
-                QLabel {
-                    color: #FFFFFF;
-                }
-                QPushButton {
-                    background-color: #3E3E42;
-                    color: #FFFFFF;
-                    border: 1px solid #555555;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #555555;
-                }
-                QPushButton:pressed {
-                    background-color: #007ACC;
-                }
-                QTextEdit {
-                    background-color: #1E1E1E;
-                    color: #FFFFFF;
-                    border: 1px solid #3E3E42;
-                }
-                QProgressBar {
-                    border: 1px solid #3E3E42;
-                    border-radius: 3px;
-                    background-color: #1E1E1E;
-                }
-                QProgressBar::chunk {
-                    background-color: #007ACC;
-                    width: 1px;
-                }
-            """)
-        else:  # Light theme
-            self.setStyleSheet("""
-                QMainWindow, QWidget {
-                    background-color: #F0F0F0;
-                    color: #000000;
-                }
-                QLabel {
-                    color: #000000;
-                }
-                QPushButton {
-                    background-color: #E0E0E0;
-                    color: #000000;
-                    border: 1px solid #CCCCCC;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #CCCCCC;
-                }
-                QPushButton:pressed {
-                    background-color: #007ACC;
-                    color: #FFFFFF;
-                }
-                QTextEdit {
-                    background-color: #FFFFFF;
-                    color: #000000;
-                    border: 1px solid #CCCCCC;
-                }
-                QProgressBar {
-                    border: 1px solid #CCCCCC;
-                    border-radius: 3px;
-                    background-color: #FFFFFF;
-                }
-                QProgressBar::chunk {
-                    background-color: #007ACC;
-                    width: 1px;
-                }
-            """)
+        qss = _DARK_QSS if theme == "dark" else _LIGHT_QSS
+        
+        # Re-applying the same sheet would still re-polish every widget
+        if qss is self._current_qss:
+            return
+        self._current_qss = qss
+        
+        # Scoped to the widgets that are themed, so Qt does not re-match the
+        # rules against the whole window (menus, tray menu, ...)
+        self.central_widget.setStyleSheet(qss)
+        self.statusBar().setStyleSheet(qss)
     
     def connect_events(self):
         """Connect to engine events"""
-        from utils.event_bus import EventBus
+        from utils.event_bus import EventBus, EventType
         event_bus = EventBus()
         
-        # Connect to assistant events
-        event_bus.subscribe("assistant_activated", self.on_assistant_activated)
-        event_bus.subscribe("assistant_deactivated", self.on_assistant_deactivated)
-        event_bus.subscribe("wake_word_detected", self.on_wake_word_detected)
-        event_bus.subscribe("speech_recognized", self.on_speech_recognized)
-        event_bus.subscribe("command_processed", self.on_command_processed)
-        event_bus.subscribe("error", self.on_error)
+        # Audio levels drive the activity indicator; no polling
+        self.audio_level_changed.connect(self.update_activity_indicator)
+        event_bus.subscribe(EventType.AUDIO_LEVEL)(self.on_audio_level)
+        
+        # Handlers touch widgets, so they are always run on the GUI thread
+        self._bus_event.connect(self._deliver_bus_event)
+        
+        # Connect to assistant events; names of built-in event types resolve to them
+        handlers = {
+            "assistant_activated": self.on_assistant_activated,
+            "assistant_deactivated": self.on_assistant_deactivated,
+            "wake_word_detected": self.on_wake_word_detected,
+            "speech_recognized": self.on_speech_recognized,
+            "command_processed": self.on_command_processed,
+            "error": self.on_error,
+        }
+        for event_name, handler in handlers.items():
+            event_bus.subscribe(event_name, self._forwarder(handler))
     
-    def on_assistant_activated(self, event_data):
+    def _forwarder(self, handler):
+        """
+        Wrap a handler as an event bus subscriber that hands events to the GUI thread
+        
+        Args:
+            handler: Method taking the event
+            
+        Returns:
+            Subscriber function
+        """
+        def forward(event):
+            # Queued when published from another thread, a direct call otherwise
+            self._bus_event.emit(handler, event)
+        return forward
+    
+    @pyqtSlot(object, object)
+    def _deliver_bus_event(self, handler, event):
+        """
+        Run an event handler on the GUI thread
+        
+        Args:
+            handler: Method taking the event
+            event: Event from the event bus
+        """
+        handler(event)
+    
+    def on_assistant_activated(self, event):
         """
         Handler for assistant activation event
         
         Args:
-            event_data: Event data
+            event: Event
         """
         self.status_label.setText("Active - Listening")
-        self.status_indicator.setStyleSheet("color: blue;")
+        self.set_status_state("active")
         self.statusBar().showMessage("Listening for command...")
     
-    def on_assistant_deactivated(self, event_data):
+    def on_assistant_deactivated(self, event):
         """
         Handler for assistant deactivation event
         
         Args:
-            event_data: Event data
+            event: Event
         """
         self.status_label.setText("Ready")
-        self.status_indicator.setStyleSheet("color: green;")
+        self.set_status_state("ready")
         self.statusBar().showMessage("Ready")
     
-    def on_wake_word_detected(self, event_data):
+    def on_wake_word_detected(self, event):
         """
         Handler for wake word detection event
         
         Args:
-            event_data: Event data
+            event: Event
         """
         self.add_system_message(f"Wake word detected")
     
-    def on_speech_recognized(self, event_data):
+    def on_speech_recognized(self, event):
         """
         Handler for speech recognition event
         
         Args:
-            event_data: Event data
+            event: Event
         """
-        text = event_data.get("text", "")
+        text = (event.data or {}).get("text", "")
         if text:
             self.add_user_message(text)
     
-    def on_command_processed(self, event_data):
+    def on_command_processed(self, event):
         """
         Handler for command processed event
         
         Args:
-            event_data: Event data
+            event: Event
         """
-        response = event_data.get("response", "")
+        response = (event.data or {}).get("response", "")
         if response:
             self.add_assistant_message(response)
     
-    def on_error(self, event_data):
+    def on_error(self, event):
         """
         Handler for error event
         
         Args:
-            event_data: Event data
+            event: Event
         """
+        event_data = event.data or {}
         message = event_data.get("message", "Unknown error")
         source = event_data.get("source", "unknown")
         
         self.add_system_message(f"Error in {source}: {message}")
-        self.status_indicator.setStyleSheet("color: red;")
+        self.set_status_state("error")
         
         # Reset to green after 3 seconds
-        QTimer.singleShot(3000, lambda: self.status_indicator.setStyleSheet("color: green;"))
+        self._error_reset_timer.start()
+    
+    def _reset_status_indicator(self):
+        """Return the status indicator to the ready state after an error"""
+        self.set_status_state("ready")
+    
+    def set_status_state(self, state):
+        """
+        Switch the status indicator to another state
+        
+        Args:
+            state (str): ready, active or error
+        """
+        if self.status_indicator.property("state") == state:
+            return
+        self.status_indicator.setProperty("state", state)
+        
+        # Re-evaluate the already parsed theme rules for the new property value
+        style = self.status_indicator.style()
+        style.unpolish(self.status_indicator)
+        style.polish(self.status_indicator)
     
     def add_user_message(self, message):
         """
@@ -382,8 +570,7 @@ class MainWindow(QMainWindow):
         Args:
             message (str): Message to add
         """
-        self.conversation_display.append(f'<p style="margin-top:0px; margin-bottom:0px;"><b>You:</b> {message}</p>')
-        self.conversation_display.ensureCursorVisible()
+        self._queue_message("user", message)
     
     def add_assistant_message(self, message):
         """
@@ -392,8 +579,7 @@ class MainWindow(QMainWindow):
         Args:
             message (str): Message to add
         """
-        self.conversation_display.append(f'<p style="margin-top:0px; margin-bottom:0px;"><b>Assistant:</b> {message}</p>')
-        self.conversation_display.ensureCursorVisible()
+        self._queue_message("assistant", message)
     
     def add_system_message(self, message):
         """
@@ -402,20 +588,75 @@ class MainWindow(QMainWindow):
         Args:
             message (str): Message to add
         """
-        self.conversation_display.append(f'<p style="margin-top:0px; margin-bottom:0px; color: #888888;"><i>System: {message}</i></p>')
-        self.conversation_display.ensureCursorVisible()
-    
-    def update_activity_indicator(self):
-        """Update the voice activity indicator"""
-        # This would be connected to audio levels in a real implementation
-        # For now, just simulate some activity when the assistant is active
-        if self.engine.active:
-            # Simulate audio activity
-            import random
-            level = random.randint(0, 100)
-            self.activity_bar.setValue(level)
-        else:
-            self.activity_bar.setValue(0)
+        self._queue_message("system", message)
+    
+    def _queue_message(self, role, message):
+        """
+        Queue a message for the conversation display
+        
+        Args:
+            role (str): user, assistant or system
+            message (str): Message text
+        """
+        self._pending_messages.append((role, message))
+        if not self._message_flush_timer.isActive():
+            self._message_flush_timer.start()
+    
+    def _flush_messages(self):
+        """Add all queued messages to the conversation display in a single edit"""
+        if not self._pending_messages:
+            return
+        
+        display = self.conversation_display
+        scroll_bar = display.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        
+        # One edit block means one relayout for the whole batch
+        cursor = QTextCursor(display.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        while self._pending_messages:
+            role, message = self._pending_messages.popleft()
+            prefix, prefix_format, text_format = self._message_formats[role]
+            if not display.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(prefix, prefix_format)
+            cursor.insertText(message, text_format)
+        cursor.endEditBlock()
+        
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+    
+    def on_audio_level(self, event):
+        """
+        Handler for audio level events, called on the publishing thread
+        
+        Args:
+            event: Event whose data is the level (0-100) or a dict with a 'level' key
+        """
+        level = event.data.get("level", 0) if isinstance(event.data, dict) else event.data
+        level = int(level or 0)
+        
+        # Nothing to draw while the window is hidden (e.g. minimized to tray)
+        if not self._activity_visible:
+            return
+        
+        # Coalesce bursts, but always let silence through so the bar drops to zero
+        now = time.monotonic()
+        if level and now - self._last_level_time < AUDIO_LEVEL_MIN_INTERVAL:
+            return
+        self._last_level_time = now
+        self.audio_level_changed.emit(level)
+    
+    @pyqtSlot(int)
+    def update_activity_indicator(self, level):
+        """
+        Update the voice activity indicator
+        
+        Args:
+            level (int): Audio level (0-100)
+        """
+        self.activity_bar.setValue(max(0, min(100, level)))
     
     def on_activate_clicked(self):
         """Handler for activate button click"""
@@ -459,6 +700,27 @@ class MainWindow(QMainWindow):
         import sys
         sys.exit(0)
     
+    def showEvent(self, event):
+        """
+        Resume activity indicator updates when the window is shown
+        
+        Args:
+            event: Show event
+        """
+        self._activity_visible = True
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """
+        Stop activity indicator updates while the window is hidden
+        
+        Args:
+            event: Hide event
+        """
+        self._activity_visible = False
+        self.activity_bar.setValue(0)
+        super().hideEvent(event)
+    
     def closeEvent(self, event):
         """
         Override close event to minimize to tray instead
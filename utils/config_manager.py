@@ -3,9 +3,45 @@ Configuration manager for the Jetson TX1 Personal Assistant.
 Handles loading, validating, and accessing configuration settings.
 """
 
+import copy
 import os
+import types
 import yaml
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Tuple
+
+# Use the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Parsed YAML keyed by absolute path, valid while the file's mtime is unchanged
+_parse_cache: Dict[str, Tuple[int, Dict]] = {}
+
+# Module-level alias, since ConfigManager.to_dict's ``copy`` argument shadows the module
+_deepcopy = copy.deepcopy
+
+def _parse_file(path: str) -> Dict:
+    """
+    Parse a YAML file, reusing the previous result if the file is unchanged.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        A private copy of the parsed data
+    """
+    key = os.path.abspath(path)
+    mtime = os.stat(key).st_mtime_ns
+    
+    cached = _parse_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        with open(key, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_Loader) or {}
+        cached = _parse_cache[key] = (mtime, data)
+    
+    # Callers modify their copy (defaults, set()), so never hand out the cached one
+    return copy.deepcopy(cached[1])
 
 class ConfigManager:
     """Manages configuration settings for the assistant."""
@@ -19,13 +55,17 @@ class ConfigManager:
         """
         self.config_path = config_path
         self._config = {}
+        # Every dot-notation key -> value, rebuilt whenever the configuration changes;
+        # sections are stored as read-only views so the index cannot go stale
+        self._flat: Dict[str, Any] = {}
+        # Read-only view of the whole configuration, returned by to_dict()
+        self._frozen: Mapping = types.MappingProxyType({})
         self._load_config()
     
     def _load_config(self) -> None:
         """Load configuration from the YAML file."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f) or {}
+            self._config = _parse_file(self.config_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
@@ -33,6 +73,7 @@ class ConfigManager:
         
         # Validate the configuration
         self._validate_config()
+        self._rebuild_flat()
     
     def _validate_config(self) -> None:
         """Validate the configuration values."""
@@ -99,22 +140,37 @@ class ConfigManager:
         """
         Get a configuration value using dot notation.
         
+        Sections (e.g. 'gui') are returned as read-only
+        ``types.MappingProxyType`` views, not dicts. Item assignment,
+        ``update()`` and ``copy.deepcopy()`` raise TypeError on them. Change
+        values with set(), and use ``to_dict(copy=True)`` for configuration
+        data the caller may modify.
+        
         Args:
             key: Dot-notation key (e.g., 'gui.theme')
             default: Default value if key is not found
             
         Returns:
-            The configuration value or default if not found
+            The configuration value, a read-only view for sections, or
+            default if not found
         """
-        keys = key.split('.')
-        value = self._config
+        return self._flat.get(key, default)
+    
+    def _rebuild_flat(self) -> None:
+        """Index every section and value of the configuration by its dot-notation key."""
+        flat = {}
         
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        def index(prefix: str, section: Dict) -> Mapping:
+            view = {}
+            for k, value in section.items():
+                key = f"{prefix}{k}"
+                if isinstance(value, dict):
+                    value = index(f"{key}.", value)
+                flat[key] = view[k] = value
+            return types.MappingProxyType(view)
+        
+        self._frozen = index('', self._config)
+        self._flat = flat
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -133,16 +189,27 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
+        self._rebuild_flat()
     
     def save(self) -> None:
         """Save the current configuration to the config file."""
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self._config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
     
     def reload(self) -> None:
         """Reload the configuration from the file."""
         self._load_config()
     
+    @property
+    def logging(self) -> Mapping[str, Any]:
+        """Logging settings."""
+        return self.get('logging', {})
+    
+    @property
+    def gui(self) -> Mapping[str, Any]:
+        """GUI settings."""
+        return self.get('gui', {})
+    
     def __getitem__(self, key: str) -> Any:
         """Allow dictionary-style access to configuration."""
         return self.get(key)
@@ -159,7 +226,19 @@ class ConfigManager:
         except KeyError:
             return False
     
-    def to_dict(self) -> Dict:
-        """Return a deep copy of the configuration as a dictionary."""
-        import copy
-        return copy.deepcopy(self._config)
+    def to_dict(self, copy: bool = False) -> Mapping:
+        """
+        Get the whole configuration.
+        
+        This is the supported way to get configuration data that can be
+        modified; get() and the default view are read-only.
+        
+        Args:
+            copy: Return a deep copy that the caller may modify, instead of a read-only view
+            
+        Returns:
+            Read-only view of the configuration, or a deep copy as a dictionary
+        """
+        if copy:
+            return _deepcopy(self._config)
+        return self._frozen
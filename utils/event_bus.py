@@ -3,12 +3,17 @@ Event bus implementation for inter-component communication.
 Uses publish-subscribe pattern to allow loose coupling between components.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 import inspect
+import itertools
 import logging
+import threading
+import time
 from functools import wraps
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +33,12 @@ class EventType(Enum):
     SPEECH_START = "speech.start"
     SPEECH_END = "speech.end"
     SPEECH_RESULT = "speech.result"
+    SPEECH_RECOGNIZED = "speech.recognized"
     
     # TTS events
     TTS_START = "tts.start"
     TTS_END = "tts.end"
+    TTS_SAY = "tts.say"
     
     # GUI events
     GUI_READY = "gui.ready"
@@ -41,17 +48,99 @@ class EventType(Enum):
     SKILL_LOADED = "skill.loaded"
     SKILL_ERROR = "skill.error"
     SKILL_RESPONSE = "skill.response"
+    RESPONSE_GENERATED = "skill.response_generated"
+
+# Position of each event type in EventBus's subscriber table. Stored on the
+# member itself since hashing an Enum member runs Enum.__hash__ in Python.
+for _ordinal, _event_type in enumerate(EventType):
+    _event_type._ordinal = _ordinal
+del _ordinal, _event_type
+
+# Event types by value ("speech.recognized") and by lowercased name ("speech_recognized")
+_EVENT_TYPES_BY_NAME: Dict[str, EventType] = {
+    **{event_type.name.lower(): event_type for event_type in EventType},
+    **{event_type.value: event_type for event_type in EventType},
+}
+
+EventKey = Union[EventType, str]
+
+def intern_event_type(event_type: EventKey) -> EventKey:
+    """
+    Resolve an event name to its EventType.
+    
+    Args:
+        event_type: EventType, or its value or lowercased name. Other strings
+            are custom event names and are returned unchanged.
+            
+    Returns:
+        The EventType, or the custom event name
+    """
+    if isinstance(event_type, str):
+        return _EVENT_TYPES_BY_NAME.get(event_type, event_type)
+    return event_type
 
 @dataclass
 class Event:
     """Event data class."""
-    event_type: EventType
+    event_type: EventKey
     data: Any = None
     source: str = None
     
+    def __post_init__(self):
+        # Events named by string reach the subscribers of the matching EventType
+        self.event_type = intern_event_type(self.event_type)
+    
     def __str__(self):
         return f"Event({self.event_type}, source={self.source or 'system'})"
 
+# Subscriber parameters filled from the event, by name
+_EVENT_FIELDS: Dict[str, Callable] = {
+    'event': lambda event: event,
+    'event_type': attrgetter('event_type'),
+    'data': attrgetter('data'),
+    'source': attrgetter('source'),
+}
+
+def _make_dispatcher(subscriber: Callable) -> Callable[[Event], Any]:
+    """
+    Work out once how to call a subscriber with an event.
+    
+    Args:
+        subscriber: Subscriber function
+        
+    Returns:
+        Function taking an event and calling the subscriber with the right arguments
+    """
+    params = inspect.signature(subscriber).parameters
+    
+    if len(params) == 0:
+        return lambda event: subscriber()
+    elif len(params) == 1:
+        return subscriber
+    
+    # Match parameters by name, falling back to their defaults
+    fields = [(name, _EVENT_FIELDS[name]) for name in params if name in _EVENT_FIELDS]
+    defaults = {
+        name: param.default for name, param in params.items()
+        if name not in _EVENT_FIELDS and param.default is not inspect.Parameter.empty
+    }
+    
+    # Only call if we can satisfy all required parameters
+    required_params = [
+        name for name, param in params.items()
+        if param.default is inspect.Parameter.empty and param.kind != param.VAR_KEYWORD
+    ]
+    if not all(name in _EVENT_FIELDS for name in required_params):
+        return lambda event: None
+    
+    def dispatch(event: Event):
+        kwargs = dict(defaults)
+        for name, get in fields:
+            kwargs[name] = get(event)
+        subscriber(**kwargs)
+    
+    return dispatch
+
 class EventBus:
     """Event bus for inter-component communication."""
     
@@ -66,83 +155,184 @@ class EventBus:
     
     def _initialize(self):
         """Initialize the event bus."""
-        self._subscribers: Dict[EventType, List[Callable]] = {}
-        self._wildcard_subscribers: List[Callable] = []
-        self._event_history: List[Tuple[float, Event]] = []
+        # Subscriber tuples are replaced, never mutated, so publishing can
+        # iterate them while other threads subscribe or unsubscribe. Replacing
+        # them is a read-modify-write, so subscribe/unsubscribe hold this lock.
+        self._lock = threading.Lock()
+        self._subscribers: Dict[EventKey, Tuple[Callable, ...]] = {}
+        self._wildcard_subscribers: Tuple[Callable, ...] = ()
         self._max_history = 1000  # Keep last 1000 events
+        self._event_history: Deque[Tuple[int, Event]] = deque(maxlen=self._max_history)
+        
+        # Subscriber -> function that calls it with an event, see _make_dispatcher().
+        # Only written by subscribe/unsubscribe, under self._lock.
+        self._plans: Dict[Callable, Callable[[Event], Any]] = {}
+        
+        # Subscribers of each EventType by its ordinal, mirroring _subscribers
+        # so publishing built-in events is a list index instead of a dict lookup
+        self._by_ordinal: List[Tuple[Callable, ...]] = [() for _ in EventType]
+    
+    def _set_subscribers(self, event_type: EventKey, subscribers: Tuple[Callable, ...]):
+        """
+        Replace the subscribers of an event type. Callers hold self._lock.
+        
+        Args:
+            event_type: Interned event type or custom event name
+            subscribers: New subscriber tuple
+        """
+        self._subscribers[event_type] = subscribers
+        if type(event_type) is EventType:
+            self._by_ordinal[event_type._ordinal] = subscribers
     
-    def subscribe(self, event_type: Optional[EventType] = None):
+    def _subscribers_for(self, event_type: EventKey) -> Tuple[Callable, ...]:
         """
-        Decorator to subscribe a function to an event type.
+        Get the subscribers of an event type.
         
         Args:
-            event_type: Event type to subscribe to. If None, subscribes to all events.
+            event_type: Interned event type or custom event name
             
         Returns:
-            Decorator function
+            Subscriber tuple, empty if there are none
+        """
+        if type(event_type) is EventType:
+            return self._by_ordinal[event_type._ordinal]
+        return self._subscribers.get(event_type, ())
+    
+    def subscribe(self, event_type: Optional[EventKey] = None, func: Optional[Callable] = None):
         """
+        Subscribe a function to an event type.
+        
+        Used as a decorator, ``@event_bus.subscribe(EventType.STARTUP)``, or
+        called directly as ``event_bus.subscribe("speech_recognized", handler)``.
+        
+        Args:
+            event_type: Event type or event name to subscribe to. If None, subscribes to all events.
+            func: Function to subscribe right away instead of returning a decorator
+            
+        Returns:
+            Decorator function, or func itself when it was given
+        """
+        event_type = intern_event_type(event_type)
+        
         def decorator(func):
-            if event_type is None:
-                if func not in self._wildcard_subscribers:
-                    self._wildcard_subscribers.append(func)
-            else:
-                if event_type not in self._subscribers:
-                    self._subscribers[event_type] = []
-                if func not in self._subscribers[event_type]:
-                    self._subscribers[event_type].append(func)
+            with self._lock:
+                if func not in self._plans:
+                    try:
+                        self._plans[func] = _make_dispatcher(func)
+                    except (TypeError, ValueError):
+                        pass  # No signature; the error is reported when publishing
+                if event_type is None:
+                    if func not in self._wildcard_subscribers:
+                        self._wildcard_subscribers += (func,)
+                else:
+                    subscribers = self._subscribers.get(event_type, ())
+                    if func not in subscribers:
+                        self._set_subscribers(event_type, subscribers + (func,))
             return func
+        
+        if func is not None:
+            return decorator(func)
         return decorator
     
-    def unsubscribe(self, func: Callable, event_type: Optional[EventType] = None):
+    def unsubscribe(self, func: Callable, event_type: Optional[EventKey] = None):
         """
         Unsubscribe a function from an event type or all events.
         
         Args:
             func: Function to unsubscribe
-            event_type: Event type to unsubscribe from. If None, unsubscribes from all events.
+            event_type: Event type or event name to unsubscribe from. If None, unsubscribes from all events.
         """
-        if event_type is None:
-            # Remove from all event types
-            for subscribers in self._subscribers.values():
+        event_type = intern_event_type(event_type)
+        with self._lock:
+            if event_type is None:
+                # Remove from all event types
+                for key, subscribers in list(self._subscribers.items()):
+                    if func in subscribers:
+                        self._set_subscribers(key, tuple(s for s in subscribers if s != func))
+                if func in self._wildcard_subscribers:
+                    self._wildcard_subscribers = tuple(s for s in self._wildcard_subscribers if s != func)
+            else:
+                # Remove from specific event type
+                subscribers = self._subscribers.get(event_type, ())
                 if func in subscribers:
-                    subscribers.remove(func)
-            if func in self._wildcard_subscribers:
-                self._wildcard_subscribers.remove(func)
-        else:
-            # Remove from specific event type
-            if event_type in self._subscribers and func in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(func)
+                    self._set_subscribers(event_type, tuple(s for s in subscribers if s != func))
+            
+            # Keep the dispatch plan while func is still subscribed elsewhere
+            if func not in self._wildcard_subscribers and not any(
+                    func in subscribers for subscribers in self._subscribers.values()):
+                self._plans.pop(func, None)
     
-    def publish(self, event: Event):
+    def publish(self, event: Union[Event, EventKey], data: Any = None, source: str = None):
         """
         Publish an event to all subscribers.
         
         Args:
-            event: Event to publish
+            event: Event to publish, or an event type or name to build one from
+            data: Event data, when event is a type or name
+            source: Event source, when event is a type or name
         """
-        if not isinstance(event, Event):
+        if isinstance(event, (EventType, str)):
+            event = Event(event_type=event, data=data, source=source)
+        elif not isinstance(event, Event):
             raise ValueError("Event must be an instance of Event class")
         
-        # Add to history
-        self._event_history.append((time.time(), event))
-        self._event_history = self._event_history[-self._max_history:]
+        self._record(event)
+        self._dispatch(
+            event,
+            self._subscribers_for(event.event_type),
+            self._wildcard_subscribers
+        )
+    
+    def publish_many(self, events: List[Event]):
+        """
+        Publish several events, in order, to all subscribers.
+        
+        Args:
+            events: Events to publish
+        """
+        for event in events:
+            if not isinstance(event, Event):
+                raise ValueError("Event must be an instance of Event class")
+        
+        wildcard_subscribers = self._wildcard_subscribers
+        subscribers_for = self._subscribers_for
+        for event in events:
+            self._record(event)
+            self._dispatch(event, subscribers_for(event.event_type), wildcard_subscribers)
+    
+    def _record(self, event: Event):
+        """
+        Add an event to the history.
+        
+        Args:
+            event: Published event
+        """
+        self._event_history.append((time.monotonic_ns(), event))
         
-        logger.debug(f"Publishing event: {event}")
+        logger.debug("Publishing event: %s", event)
+    
+    def _dispatch(self, event: Event, subscribers, wildcard_subscribers):
+        """
+        Deliver an event to its type's subscribers and the wildcard subscribers.
         
+        Args:
+            event: Event to deliver
+            subscribers: Subscribers for the event's type
+            wildcard_subscribers: Subscribers for all events
+        """
         # Notify specific subscribers
-        if event.event_type in self._subscribers:
-            for subscriber in self._subscribers[event.event_type]:
-                try:
-                    self._call_subscriber(subscriber, event)
-                except Exception as e:
-                    logger.error(f"Error in subscriber for {event.event_type}: {e}", exc_info=True)
+        for subscriber in subscribers:
+            try:
+                self._call_subscriber(subscriber, event)
+            except Exception as e:
+                logger.error("Error in subscriber for %s: %s", event.event_type, e, exc_info=True)
         
         # Notify wildcard subscribers
-        for subscriber in self._wildcard_subscribers:
+        for subscriber in wildcard_subscribers:
             try:
                 self._call_subscriber(subscriber, event)
             except Exception as e:
-                logger.error(f"Error in wildcard subscriber: {e}", exc_info=True)
+                logger.error("Error in wildcard subscriber: %s", e, exc_info=True)
     
     def _call_subscriber(self, subscriber: Callable, event: Event):
         """
@@ -152,39 +342,13 @@ class EventBus:
             subscriber: Subscriber function
             event: Event to pass to the subscriber
         """
-        sig = inspect.signature(subscriber)
-        params = sig.parameters
-        
-        if len(params) == 0:
-            subscriber()
-        elif len(params) == 1:
-            subscriber(event)
-        else:
-            # Try to match parameters by name
-            kwargs = {}
-            for name, param in params.items():
-                if name == 'event':
-                    kwargs[name] = event
-                elif name == 'event_type':
-                    kwargs[name] = event.event_type
-                elif name == 'data':
-                    kwargs[name] = event.data
-                elif name == 'source':
-                    kwargs[name] = event.source
-                else:
-                    if param.default is not inspect.Parameter.empty:
-                        kwargs[name] = param.default
-            
-            # Only call if we can satisfy all required parameters
-            required_params = [
-                name for name, param in params.items()
-                if param.default is inspect.Parameter.empty and param.kind != param.VAR_KEYWORD
-            ]
-            
-            if all(name in kwargs for name in required_params):
-                subscriber(**kwargs)
+        dispatch = self._plans.get(subscriber)
+        if dispatch is None:
+            # Unsubscribed since the caller took its snapshot; don't store a plan for it
+            dispatch = _make_dispatcher(subscriber)
+        dispatch(event)
     
-    def get_history(self, limit: int = 100) -> List[Tuple[float, Event]]:
+    def get_history(self, limit: int = 100) -> List[Tuple[int, Event]]:
         """
         Get recent event history.
         
@@ -192,30 +356,42 @@ class EventBus:
             limit: Maximum number of events to return
             
         Returns:
-            List of (timestamp, event) tuples, most recent first
+            List of (time.monotonic_ns() timestamp, event) tuples, oldest first
         """
-        return self._event_history[-limit:]
+        history = self._event_history
+        return list(itertools.islice(history, max(0, len(history) - limit), None))
 
 # Global event bus instance
 event_bus = EventBus()
 
-def on_event(event_type: Optional[EventType] = None):
+def on_event(event_type: Optional[EventKey] = None):
     """
     Decorator to subscribe a function to an event type.
     
     Args:
-        event_type: Event type to subscribe to. If None, subscribes to all events.
+        event_type: Event type or event name to subscribe to. If None, subscribes to all events.
         
     Returns:
         Decorator function
     """
     return event_bus.subscribe(event_type)
 
-def publish(event: Event):
+def publish(event: Union[Event, EventKey], data: Any = None, source: str = None):
     """
     Publish an event to the global event bus.
     
     Args:
-        event: Event to publish
+        event: Event to publish, or an event type or name to build one from
+        data: Event data, when event is a type or name
+        source: Event source, when event is a type or name
+    """
+    event_bus.publish(event, data, source)
+
+def publish_many(events: List[Event]):
+    """
+    Publish several events, in order, to the global event bus.
+    
+    Args:
+        events: Events to publish
     """
-    event_bus.publish(event)
+    event_bus.publish_many(events)
@@ -3,30 +3,452 @@ Logging utility for the Jetson TX1 Personal Assistant.
 Provides centralized logging with file rotation and console output.
 """
 
+import codecs
+import functools
+import gzip
+import locale
 import logging
 import logging.handlers
 import os
+import shutil
 import sys
-from typing import Optional
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Union
+
+# The log format never shows thread, process or task details, so don't
+# collect them for every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+
+# Level names accepted by setup_logger, including logging's aliases
+_LEVELS: Dict[str, int] = {
+    'NOTSET': logging.NOTSET,
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'WARN': logging.WARN,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+    'FATAL': logging.FATAL,
+}
+
+# Log directories already created by setup_logger in this process
+_ensured_dirs: Set[str] = set()
+
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter for the "%(asctime)s - %(name)s - %(levelname)s - %(message)s" layout.
+    
+    Records logged within the same second share one formatted timestamp,
+    and the line is built with an f-string instead of %-formatting.
+    """
+    
+    def __init__(self):
+        """Initialize the formatter."""
+        super().__init__('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt=LOG_DATE_FORMAT)
+        # (second, formatted timestamp) of the last record, swapped as one tuple
+        self._cached_ts = (-1, '')
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record.
+        
+        Args:
+            record: Record to format
+            
+        Returns:
+            Formatted log line, followed by any exception and stack text
+        """
+        record.message = record.getMessage()
+        
+        sec = int(record.created)
+        cached_sec, asctime = self._cached_ts
+        if sec != cached_sec:
+            asctime = time.strftime(LOG_DATE_FORMAT, self.converter(sec))
+            self._cached_ts = (sec, asctime)
+        record.asctime = asctime
+        
+        s = f"{asctime} - {record.name} - {record.levelname} - {record.message}"
+        
+        # Same exception and stack handling as logging.Formatter
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+        return s
+
+class _BoundFormatMixin:
+    """
+    Handler mixin that calls the formatter through a bound method saved by
+    setFormatter(), instead of looking it up on every record.
+    """
+    
+    # Used until a formatter is set, like logging's default formatter
+    _format = logging.Formatter().format
+    
+    def setFormatter(self, fmt: Optional[logging.Formatter]):
+        """Set the formatter and keep its format method."""
+        super().setFormatter(fmt)
+        self._format = fmt.format if fmt else _BoundFormatMixin._format
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record with the handler's formatter."""
+        return self._format(record)
+
+# Characters of console output buffered before a flush is forced
+CONSOLE_BUFFER_SIZE = 65536
+
+# Seconds between flushes of buffered console output
+CONSOLE_FLUSH_INTERVAL = 0.1
+
+class BufferedStreamHandler(_BoundFormatMixin, logging.StreamHandler):
+    """
+    Stream handler that buffers records instead of flushing each one.
+    
+    Records below WARNING are collected and written by a flush thread
+    CONSOLE_FLUSH_INTERVAL after the first of them arrives, or once
+    CONSOLE_BUFFER_SIZE characters are waiting. Warnings and errors are
+    flushed right away. The flush thread sleeps while nothing is buffered.
+    """
+    
+    def __init__(self, stream=None):
+        """
+        Initialize the handler and start its flush thread.
+        
+        Args:
+            stream: Stream to write to, sys.stderr if None
+        """
+        super().__init__(stream)
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._has_buffered = threading.Event()
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+        self._flusher.start()
+    
+    def emit(self, record: logging.LogRecord):
+        """Buffer a formatted record, flushing for warnings and errors."""
+        try:
+            msg = self.format(record) + self.terminator
+            if not self._buffer:
+                self._has_buffered.set()
+            self._buffer.append(msg)
+            self._buffered += len(msg)
+            if record.levelno >= logging.WARNING or self._buffered >= CONSOLE_BUFFER_SIZE:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Write buffered records to the stream in one call and flush it."""
+        self.acquire()
+        try:
+            if self._buffer:
+                self.stream.write(''.join(self._buffer))
+                self._buffer.clear()
+                self._buffered = 0
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+    
+    def _flush_periodically(self):
+        """Flush thread: flush each batch of buffered records until close()."""
+        while True:
+            # Sleep until emit() buffers a record, then let the batch build up
+            self._has_buffered.wait()
+            if self._stop_flushing.wait(CONSOLE_FLUSH_INTERVAL):
+                return
+            self._has_buffered.clear()
+            self.flush()
+    
+    def close(self):
+        """Stop the flush thread and write out buffered records."""
+        self._stop_flushing.set()
+        self._has_buffered.set()
+        self.flush()
+        super().close()
+
+# Most records the writer thread gathers into one write
+LOG_WRITE_BATCH = 64
+
+# gzip level for rotated log files; the fastest, to keep the writer thread moving
+LOG_COMPRESS_LEVEL = 1
+
+def _gzip_namer(name: str) -> str:
+    """Name of a compressed rotated log file."""
+    return name + '.gz'
+
+def _gzip_rotator(source: str, dest: str):
+    """
+    Compress a rotated log file into dest and remove the original.
+    
+    Args:
+        source: Log file being rotated
+        dest: Path of the compressed backup
+    """
+    with open(source, 'rb') as src, gzip.open(dest, 'wb', compresslevel=LOG_COMPRESS_LEVEL) as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+# Vectored write, where the platform has one
+_writev = getattr(os, 'writev', None)
+
+# Seconds a busy writer thread waits for more records before going idle
+LOG_WRITE_INTERVAL = 0.1
+
+class AsyncFileHandler(_BoundFormatMixin, logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes from a background thread.
+    
+    emit() only formats and encodes the record and appends it to a pending
+    deque. A writer thread drains the deque in batches with one write per
+    batch, so logging callers never block on the (often slow) SD card, and
+    the writer deals in bytes alone. While records keep arriving the writer
+    picks them up every LOG_WRITE_INTERVAL on its own; emit() only has to
+    wake it once it has gone idle.
+    
+    Appending to a deque is thread-safe, so records are handed over without
+    taking the handler lock. Records dropped because the deque was full are
+    counted and reported in the log file once the writer catches up.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        queue_size: Optional[int] = None,
+        compress: bool = False
+    ):
+        """
+        Initialize the handler and start its writer thread.
+        
+        Args:
+            filename: Path to the log file
+            maxBytes: File size in bytes before rotation, 0 to never rotate
+            backupCount: Number of rotated files to keep
+            encoding: File encoding
+            queue_size: Most records waiting for the writer thread. When it
+                falls behind, the oldest are dropped rather than blocking
+                callers, and a warning with the number dropped is written
+                afterwards. None for no limit.
+            compress: Whether to gzip rotated files. Rotation runs on the
+                writer thread, so callers don't wait for the compression.
+        """
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        # FileHandler stores 'locale' when no encoding is given
+        encoding = self.encoding
+        if encoding in (None, 'locale'):
+            encoding = locale.getpreferredencoding(False)
+        # str.encode() without arguments goes straight to CPython's UTF-8 encoder
+        if codecs.lookup(encoding).name == 'utf-8':
+            self._encode = str.encode
+        else:
+            self._encode = functools.partial(str.encode, encoding=encoding)
+        if compress:
+            self.namer = _gzip_namer
+            self.rotator = _gzip_rotator
+        self._pending: Deque[bytes] = deque(maxlen=queue_size)
+        # Records pushed out of the full deque, and how many of them the
+        # writer has reported. Only emit() counts and only the writer reports.
+        self._dropped = 0
+        self._reported_dropped = 0
+        self._wakeup = threading.Event()
+        self._idle = False
+        self._closing = False
+        self._writer = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._writer.start()
+    
+    def handle(self, record: logging.LogRecord):
+        """
+        Filter and emit a record without taking the handler lock.
+        
+        Args:
+            record: Record to handle
+            
+        Returns:
+            Result of the filters
+        """
+        rv = self.filter(record)
+        if rv:
+            if isinstance(rv, logging.LogRecord):
+                record = rv
+            self.emit(record)
+        return rv
+    
+    def emit(self, record: logging.LogRecord):
+        """Queue a formatted, encoded record for the writer thread."""
+        try:
+            data = self._encode(self.format(record) + self.terminator)
+            pending = self._pending
+            if len(pending) == pending.maxlen:
+                self._dropped += 1
+            pending.append(data)
+            if self._idle:
+                self._idle = False
+                self._wakeup.set()
+        except Exception:
+            self.handleError(record)
+    
+    def _drain(self):
+        """Writer thread: write pending messages until close()."""
+        pending, wakeup = self._pending, self._wakeup
+        popleft = pending.popleft
+        while True:
+            while pending:
+                self._write([popleft() for _ in range(min(len(pending), LOG_WRITE_BATCH))])
+            if self._dropped != self._reported_dropped:
+                self._report_dropped()
+            if self._closing:
+                return
+            
+            # Give a burst time to build up the next batch
+            wakeup.clear()
+            wakeup.wait(LOG_WRITE_INTERVAL)
+            if pending or self._closing:
+                continue
+            
+            # Nothing arrived: sleep until emit() or close() wakes us. The
+            # flag is raised before the final check so no record is missed.
+            wakeup.clear()
+            self._idle = True
+            if not pending and not self._closing:
+                wakeup.wait()
+            self._idle = False
+    
+    def _report_dropped(self):
+        """Write a warning with the number of records dropped since the last one."""
+        dropped = self._dropped
+        count = dropped - self._reported_dropped
+        self._reported_dropped = dropped
+        record = logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': logging.getLevelName(logging.WARNING),
+            'msg': "%d log records dropped, the log writer fell behind",
+            'args': (count,),
+        })
+        self._write([self._encode(self.format(record) + self.terminator)])
+    
+    def _open(self):
+        """Open the log file for unbuffered binary appends and note its size."""
+        stream = open(self.baseFilename, 'ab', buffering=0)
+        # Rotation is decided from this count rather than the stream position
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def _write(self, messages: List[bytes]):
+        """
+        Write messages to the file, rotating it as needed.
+        
+        Each stretch between rotations reaches the file in a single vectored
+        write. Only the writer thread touches the stream, so no lock is
+        needed.
+        
+        Args:
+            messages: Encoded messages, each ending in the terminator
+        """
+        try:
+            size = self._bytes_written
+            chunk: List[bytes] = []
+            for data in messages:
+                if self.maxBytes > 0 and size + len(data) >= self.maxBytes:
+                    self._write_all(chunk)
+                    chunk = []
+                    self.doRollover()
+                    size = self._bytes_written
+                chunk.append(data)
+                size += len(data)
+            self._write_all(chunk)
+            self._bytes_written = size
+        except Exception:
+            if logging.raiseExceptions and sys.stderr:
+                traceback.print_exc(file=sys.stderr)
+    
+    def _write_all(self, chunks: List[bytes]):
+        """
+        Write byte strings to the unbuffered stream, retrying partial writes.
+        
+        Uses one vectored os.writev() call where available, otherwise one
+        write of the joined bytes.
+        
+        Args:
+            chunks: Byte strings to write, in order
+        """
+        if not chunks:
+            return
+        
+        if _writev is None:
+            view = memoryview(b''.join(chunks))
+            while view:
+                view = view[self.stream.write(view):]
+            return
+        
+        fd = self.stream.fileno()
+        while chunks:
+            written = _writev(fd, chunks)
+            # Drop the chunks written in full and trim the one cut short
+            done = 0
+            while done < len(chunks) and written >= len(chunks[done]):
+                written -= len(chunks[done])
+                done += 1
+            chunks = chunks[done:]
+            if chunks and written:
+                chunks[0] = memoryview(chunks[0])[written:]
+    
+    def close(self):
+        """Write out queued messages, stop the writer thread and close the file."""
+        if self._writer.is_alive():
+            self._closing = True
+            self._wakeup.set()
+            self._writer.join()
+        super().close()
 
 def setup_logger(
     name: str = 'assistant',
-    level: str = 'INFO',
+    level: Union[str, int] = 'INFO',
     log_file: Optional[str] = None,
     max_size: int = 10,  # MB
     backup_count: int = 3,
-    console: bool = True
+    console: bool = True,
+    queue_size: int = 100000,
+    compress: bool = False
 ) -> logging.Logger:
     """
     Set up a logger with file and console handlers.
     
+    Neither handler writes on the calling thread: console output is flushed
+    in batches by BufferedStreamHandler and the log file is written by
+    AsyncFileHandler's writer thread.
+    
     Args:
         name: Logger name
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Logging level name (DEBUG, INFO, WARNING, ERROR, CRITICAL, or
+            the aliases WARN, FATAL and NOTSET) or number. Unknown names
+            fall back to INFO with a warning.
         log_file: Path to log file (optional)
         max_size: Maximum log file size in MB before rotation
         backup_count: Number of backup logs to keep
         console: Whether to log to console
+        queue_size: Most records waiting to be written to the log file
+        compress: Whether to gzip rotated log files
         
     Returns:
         Configured logger instance
@@ -34,23 +456,26 @@ def setup_logger(
     # Create logger
     logger = logging.getLogger(name)
     
-    # Clear any existing handlers
-    if logger.hasHandlers():
+    # Clear any existing handlers, first writing out what they still hold
+    if logger.handlers:
+        for handler in logger.handlers:
+            handler.close()
         logger.handlers.clear()
     
     # Set log level
-    log_level = getattr(logging, level.upper(), logging.INFO)
-    logger.setLevel(log_level)
+    if isinstance(level, int):
+        log_level = level
+    else:
+        log_level = _LEVELS.get(level.strip().upper())
+    unknown_level = log_level is None
+    logger.setLevel(logging.INFO if unknown_level else log_level)
     
     # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = FastFormatter()
     
     # Add console handler
     if console:
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = BufferedStreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
     
@@ -58,28 +483,47 @@ def setup_logger(
     if log_file:
         # Ensure log directory exists
         log_dir = os.path.dirname(os.path.abspath(log_file))
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir and log_dir not in _ensured_dirs:
             os.makedirs(log_dir, exist_ok=True)
+            _ensured_dirs.add(log_dir)
         
-        # Create rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        # Create rotating file handler, written from a background thread
+        file_handler = AsyncFileHandler(
             filename=log_file,
             maxBytes=max_size * 1024 * 1024,  # Convert MB to bytes
             backupCount=backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            queue_size=queue_size,
+            compress=compress
         )
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    if unknown_level:
+        logger.warning("Unknown log level %r, using INFO", level)
+    
     return logger
 
-# Create a default logger instance
-logger = setup_logger()
+def __getattr__(name: str):
+    """
+    Create the default logger on first access to ``utils.logger.logger``.
+    
+    Importing the module no longer sets up handlers for code that never
+    uses the default logger.
+    """
+    if name == 'logger':
+        default_logger = globals()['logger'] = setup_logger()
+        return default_logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get a logger instance with the given name.
     
+    logging.getLogger() always returns the same Logger for a name, so
+    lookups are memoized to skip the logging module lock on repeat calls.
+    
     Args:
         name: Logger name. If None, returns the root logger.
         